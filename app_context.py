@@ -52,20 +52,17 @@ from landing_gear_controller import LandingGearController
 from command_recorder import CommandRecorder
 from fault_recorder import FaultRecorder
 
-from cli_support import MutableBool, MutableFloat, PositionSensorBank, ControlLoop
+from cli_support import Environment, PositionSensorBank, ControlLoop
 
 
-@dataclass
+@dataclass(slots=True)
 class AppContext:
     controller: LandingGearController
     config: GearConfiguration
     clock: Callable[[], float]
     shutdown_event: Event
 
-    altitude: MutableFloat
-    normal: MutableBool
-    power: MutableBool
-    wow: MutableBool
+    env: Environment
     sensors: PositionSensorBank
     loop: ControlLoop
 
@@ -31,15 +31,13 @@ It is not flight-certified and must not be used in operational systems.
 
 Dependencies:
 - Python 3.10+
-- threading (standard library)
-- time (standard library)
-- dataclasses (standard library)
+- functools (standard library)
+- sys (standard library)
 - typing (standard library)
 - landing_gear_controller.py
 - cli_support.py
 - app_context.py
 - sims/position_simulator.py
-- Optional: fault_recorder.py
 
 Related Documents:
 - LGCS Requirements Specification
@@ -53,72 +51,59 @@ or safety-critical systems.
 """
 
 
-import threading
-import time
-from dataclasses import dataclass
-from pathlib import Path
-from typing import Callable, Sequence
+import functools
+import sys
+from typing import Callable
 
-from gear_configuration import GearConfiguration
 from gear_states import GearState
 from landing_gear_controller import LandingGearController
 from sims.position_simulator import PositionSensorReading, SensorStatus
-from cli_support import MutableBool, MutableFloat, PositionSensorBank, ControlLoop
+from cli_support import Environment, PositionSensorBank, StdinReader
 from app_context import AppContext
-from command_recorder import CommandRecorder
-
-try:
-    from fault_recorder import FaultRecorder
-except Exception:
-    FaultRecorder = None
-
-
-def _fmt_sensor(r: PositionSensorReading) -> str:
-    status = "OK" if r.status == SensorStatus.OK else "FAILED"
-    return f"{status}:{r.position_norm:.3f}"
 
 
 def _print_status(
     controller: LandingGearController,
-    altitude: MutableFloat,
-    normal: MutableBool,
-    power: MutableBool,
-    wow: MutableBool,
+    env: Environment,
     sensors: PositionSensorBank,
 ) -> None:
-    print("\n=== STATUS ===")
-    print(f"State: {controller.state.name}")
-    print(f"WOW: {wow.value}")
-    print(f"Altitude_ft: {altitude.value:.1f}  Normal: {normal.value}")
-    print(f"PrimaryPowerPresent: {power.value}")
-    print(f"PositionEstimateNorm: {controller.position_estimate_norm}")
-
-    # Maintenance fault visibility
-    mf_active = getattr(controller, "_maintenance_fault_active", None)
-    mf_codes = getattr(controller, "_maintenance_fault_codes", None)
-    if mf_active is not None:
-        print(f"MaintenanceFaultActive: {mf_active}")
-    if mf_codes is not None:
-        print(f"MaintenanceFaultCodes: {sorted(list(mf_codes))}")
+    snap = controller.snapshot()
+
+    lines = [
+        "",
+        "=== STATUS ===",
+        f"State: {snap.state.name}",
+        f"WOW: {env.wow}",
+        f"Altitude_ft: {env.altitude:.1f}  Normal: {env.normal}",
+        f"PrimaryPowerPresent: {env.power}",
+        f"PositionEstimateNorm: {snap.position_estimate_norm}",
+        # Maintenance fault visibility
+        f"MaintenanceFaultActive: {snap.maintenance_fault_active}",
+        f"MaintenanceFaultCodes: {snap.maintenance_fault_codes}",
+    ]
 
     # PR004 visibility
-    if hasattr(controller, "_fault_classified_ts") and hasattr(controller, "fault_classification_latency_ms"):
-        codes = sorted(list(getattr(controller, "_fault_classified_ts").keys()))
-        if codes:
-            print("FaultClassificationLatencyMs:")
-            for c in codes:
-                lat = controller.fault_classification_latency_ms(c)
-                print(f"  - {c}: {lat:.3f}" if lat is not None else f"  - {c}: None")
+    latency_ms = getattr(controller, "fault_classification_latency_ms", None)
+    if snap.fault_classified_codes and latency_ms is not None:
+        lines.append("FaultClassificationLatencyMs:")
+        for c in snap.fault_classified_codes:
+            lat = latency_ms(c)
+            lines.append(f"  - {c}: {lat:.3f}" if lat is not None else f"  - {c}: None")
 
     # FTHR002 debug visibility
-    sc_start = getattr(controller, "_sensor_conflict_started_at", None)
-    sc_latched = getattr(controller, "_sensor_conflict_fault_latched", None)
-    if sc_start is not None or sc_latched is not None:
-        print(f"SensorConflictStartedAt: {sc_start}")
-        print(f"SensorConflictFaultLatched: {sc_latched}")
+    lines.append(f"SensorConflictStartedAt: {snap.sensor_conflict_started_at}")
+    lines.append(f"SensorConflictFaultLatched: {snap.sensor_conflict_fault_latched}")
+
+    lines.append(f"Sensors: {sensors.get_formatted()}")
+    lines.append("=============")
+    lines.append("")
+
+    # Emit the whole block with a single write (one stdout lock/flush instead of one per line)
+    sys.stdout.write("\n".join(lines) + "\n")
+
 
-    print("Sensors:", ", ".join(_fmt_sensor(r) for r in sensors.get_readings()))
-    print("=============\n")
+# GearState value -> name, resolved once at import for the per-tick annunciator
+_STATE_NAMES: dict[int, str] = {s.value: s.name for s in GearState}
 
 
 class StateAnnunciator:
@@ -127,36 +112,25 @@ class StateAnnunciator:
     CLI-only presentation logic.
     """
     def __init__(self):
-        self._last_state = None
+        # Last announced GearState value (int), compared directly each tick
+        self._last_value: int | None = None
 
     def __call__(self, controller: LandingGearController) -> None:
         state = controller.state
-        if state != self._last_state:
-            name = state.name if hasattr(state, "name") else str(state)
-            print(f"STATE: {name}")
-            self._last_state = state
+        value = state.value
+        if value != self._last_value:
+            self._last_value = value
+            print(f"STATE: {_STATE_NAMES[value]}")
 
 
 def _reset_controller(controller: LandingGearController) -> None:
     # Reset transition is performed by returning to RESET state and clearing relevant latches.
     controller.enter_state(GearState.RESET)
+    controller.reset_latches()
 
-    if hasattr(controller, "_auto_deploy_latched"):
-        controller._auto_deploy_latched = False
-    if hasattr(controller, "_low_alt_warning_active"):
-        controller._low_alt_warning_active = False
-    if hasattr(controller, "_sr004_power_loss_latched"):
-        controller._sr004_power_loss_latched = False
 
-    if hasattr(controller, "_sensor_conflict_started_at"):
-        controller._sensor_conflict_started_at = None
-    if hasattr(controller, "_sensor_conflict_fault_latched"):
-        controller._sensor_conflict_fault_latched = False
-
-
-def _print_help() -> None:
-    print(
-        """
+# Static CLI text, written as-is
+_HELP = """
 Commands
   help                         Print help
   q                            Quit
@@ -186,276 +160,358 @@ State / diagnostics
   lat <fault_code>             Print PR004 latency (ms) for a fault code
   faults                       Print maintenance fault codes and recorded fault codes
   reset                        Force controller into RESET and clear latches (FTHR004 gate)
+
 """
-    )
 
+_USAGE_SENS = "Usage: sens ok <v> ok <v> ...  OR  sens mix ok <v> fail <v> ..."
 
-# cli.py
-from app_context import AppContext
 
-def run_rich_cli(ctx: AppContext) -> int:
-    controller = ctx.controller
-    altitude = ctx.altitude
-    normal = ctx.normal
-    power = ctx.power
-    wow = ctx.wow
-    sensors = ctx.sensors
-    loop = ctx.loop
+def _print_help() -> None:
+    sys.stdout.write(_HELP)
 
-    annunciator = StateAnnunciator()
 
-    recorder = ctx.command_recorder
-    if recorder is None:
-        raise RuntimeError("CommandRecorder not configured in AppContext")
+# Accepted flag tokens
+_ZERO_ONE = frozenset(("0", "1"))
 
-    # Attach annunicator to loop tick callback
-    loop._on_tick = annunciator 
-    # Announce state immediately
-    annunciator(controller)
+# Flyweight pool of (immutable, hashable) readings, so scripted harnesses that
+# re-send the same sensor values reuse instances instead of allocating new ones.
+_pooled_reading = functools.lru_cache(maxsize=64)(PositionSensorReading)
+
+# Sensor kind token -> status for 'sens' input
+_SENSOR_KINDS = {
+    "ok": SensorStatus.OK,
+    "fail": SensorStatus.FAILED,
+    "failed": SensorStatus.FAILED,
+}
 
+
+def _record(ctx: AppContext, command: str, action: str, success: bool) -> None:
+    ctx.command_recorder.record(command=command, action=action, success=success)
+
+
+# ---------- Exit / help ----------
+
+def _cmd_quit(ctx: AppContext, parts: list[str], cmd: str) -> bool:
+    _record(ctx, cmd, "quit", True)
+    ctx.shutdown()
+    return False
+
+
+def _cmd_help(ctx: AppContext, parts: list[str], cmd: str) -> bool:
     _print_help()
+    _record(ctx, cmd, "help", True)
+    return True
 
-    def record(command: str, action: str, success: bool) -> None:
-        recorder.record(command=command, action=action, success=success)
-
-    def dispatch(raw_cmd: str) -> bool:
-        """
-        Executes one CLI command line.
-        Returns True if the CLI should continue running, False to exit.
-        Always records (action, success) for audit.
-        """
-        cmd = raw_cmd.strip()
-        if not cmd:
-            return True
 
-        parts = cmd.split()
-        op = parts[0].lower()
+# ---------- Loop control ----------
 
-        # ---------- Exit / help ----------
-        if op in ("q", "quit", "exit"):
-            record(cmd, "quit", True)
-            ctx.shutdown()
-            return False
+def _cmd_run(ctx: AppContext, parts: list[str], cmd: str) -> bool:
+    loop = ctx.loop
+    try:
+        if len(parts) >= 2:
+            loop.set_period(float(parts[1]))
+        loop.start()
+        print(f"Loop running @ {loop.period_s:.3f}s")
+        _record(ctx, cmd, "run_loop", True)
+    except Exception:
+        _record(ctx, cmd, "run_loop", False)
+        raise
+    return True
+
+
+def _cmd_stop(ctx: AppContext, parts: list[str], cmd: str) -> bool:
+    ctx.loop.stop()
+    print("Loop stopped")
+    _record(ctx, cmd, "stop_loop", True)
+    return True
+
+
+def _cmd_period(ctx: AppContext, parts: list[str], cmd: str) -> bool:
+    if len(parts) != 2:
+        print("Usage: period <seconds>")
+        _record(ctx, cmd, "set_period", False)
+        return True
+    loop = ctx.loop
+    try:
+        loop.set_period(float(parts[1]))
+        print(f"Loop period set to {loop.period_s:.3f}s")
+        _record(ctx, cmd, "set_period", True)
+    except Exception:
+        _record(ctx, cmd, "set_period", False)
+        raise
+    return True
+
+
+def _cmd_step(ctx: AppContext, parts: list[str], cmd: str) -> bool:
+    try:
+        n = int(parts[1]) if len(parts) >= 2 else 1
+        ctx.loop.step(n)
+        print(f"Stepped {n} ticks")
+        _record(ctx, cmd, "step", True)
+    except Exception:
+        _record(ctx, cmd, "step", False)
+        raise
+    return True
+
+
+# ---------- Pilot commands ----------
+
+def _cmd_deploy(ctx: AppContext, parts: list[str], cmd: str) -> bool:
+    accepted = ctx.controller.command_gear_down(True)
+    print(f"Deploy accepted: {accepted}")
+    _record(ctx, cmd, "deploy", bool(accepted))
+    return True
+
+
+def _cmd_retract(ctx: AppContext, parts: list[str], cmd: str) -> bool:
+    accepted = ctx.controller.command_gear_up(True)
+    print(f"Retract accepted: {accepted}")
+    _record(ctx, cmd, "retract", bool(accepted))
+    return True
+
+
+# ---------- Environment ----------
+
+def _cmd_wow(ctx: AppContext, parts: list[str], cmd: str) -> bool:
+    if len(parts) != 2 or parts[1] not in _ZERO_ONE:
+        print("Usage: wow 0|1")
+        _record(ctx, cmd, "set_wow", False)
+        return True
+    env = ctx.env
+    env.wow = (parts[1] == "1")
+    ctx.controller.set_weight_on_wheels(env.wow)
+    print(f"WOW set to {env.wow}")
+    _record(ctx, cmd, "set_wow", True)
+    return True
+
+
+def _cmd_alt(ctx: AppContext, parts: list[str], cmd: str) -> bool:
+    if len(parts) != 2:
+        print("Usage: alt <feet>")
+        _record(ctx, cmd, "set_altitude", False)
+        return True
+    env = ctx.env
+    env.altitude = float(parts[1])
+    print(f"Altitude set to {env.altitude:.1f} ft")
+    _record(ctx, cmd, "set_altitude", True)
+    return True
 
-        if op in ("help", "?"):
-            _print_help()
-            record(cmd, "help", True)
-            return True
 
-        # ---------- Loop control ----------
-        if op == "run":
-            try:
-                if len(parts) >= 2:
-                    loop.set_period(float(parts[1]))
-                loop.start()
-                print(f"Loop running @ {loop.period_s:.3f}s")
-                record(cmd, "run_loop", True)
-            except Exception:
-                record(cmd, "run_loop", False)
-                raise
-            return True
+def _cmd_normal(ctx: AppContext, parts: list[str], cmd: str) -> bool:
+    if len(parts) != 2 or parts[1] not in _ZERO_ONE:
+        print("Usage: normal 0|1")
+        _record(ctx, cmd, "set_normal", False)
+        return True
+    env = ctx.env
+    env.normal = (parts[1] == "1")
+    print(f"Normal conditions set to {env.normal}")
+    _record(ctx, cmd, "set_normal", True)
+    return True
 
-        if op == "stop":
-            loop.stop()
-            print("Loop stopped")
-            record(cmd, "stop_loop", True)
-            return True
 
-        if op == "period":
-            if len(parts) != 2:
-                print("Usage: period <seconds>")
-                record(cmd, "set_period", False)
-                return True
-            try:
-                loop.set_period(float(parts[1]))
-                print(f"Loop period set to {loop.period_s:.3f}s")
-                record(cmd, "set_period", True)
-            except Exception:
-                record(cmd, "set_period", False)
-                raise
-            return True
+def _cmd_power(ctx: AppContext, parts: list[str], cmd: str) -> bool:
+    if len(parts) != 2 or parts[1] not in _ZERO_ONE:
+        print("Usage: power 0|1")
+        _record(ctx, cmd, "set_power", False)
+        return True
+    env = ctx.env
+    env.power = (parts[1] == "1")
+    print(f"Primary power present set to {env.power}")
+    _record(ctx, cmd, "set_power", True)
+    return True
 
-        if op == "step":
-            try:
-                n = int(parts[1]) if len(parts) >= 2 else 1
-                loop.step(n)
-                print(f"Stepped {n} ticks")
-                record(cmd, "step", True)
-            except Exception:
-                record(cmd, "step", False)
-                raise
-            return True
 
-        # ---------- Pilot commands ----------
-        if op == "d":
-            accepted = controller.command_gear_down(True)
-            print(f"Deploy accepted: {accepted}")
-            record(cmd, "deploy", bool(accepted))
-            return True
+# ---------- Sensors ----------
 
-        if op == "u":
-            accepted = controller.command_gear_up(True)
-            print(f"Retract accepted: {accepted}")
-            record(cmd, "retract", bool(accepted))
-            return True
+def _cmd_sens(ctx: AppContext, parts: list[str], cmd: str) -> bool:
+    sensors = ctx.sensors
 
-        # ---------- Environment ----------
-        if op == "wow":
-            if len(parts) != 2 or parts[1] not in ("0", "1"):
-                print("Usage: wow 0|1")
-                record(cmd, "set_wow", False)
-                return True
-            wow.value = (parts[1] == "1")
-            controller.set_weight_on_wheels(wow.value)
-            print(f"WOW set to {wow.value}")
-            record(cmd, "set_wow", True)
-            return True
+    if len(parts) == 2 and parts[1].lower() == "show":
+        print("Sensors:", sensors.get_formatted())
+        _record(ctx, cmd, "sens_show", True)
+        return True
 
-        if op == "alt":
-            if len(parts) != 2:
-                print("Usage: alt <feet>")
-                record(cmd, "set_altitude", False)
-                return True
-            altitude.value = float(parts[1])
-            print(f"Altitude set to {altitude.value:.1f} ft")
-            record(cmd, "set_altitude", True)
-            return True
+    if len(parts) < 3:
+        print(_USAGE_SENS)
+        _record(ctx, cmd, "sens_set", False)
+        return True
 
-        if op == "normal":
-            if len(parts) != 2 or parts[1] not in ("0", "1"):
-                print("Usage: normal 0|1")
-                record(cmd, "set_normal", False)
-                return True
-            normal.value = (parts[1] == "1")
-            print(f"Normal conditions set to {normal.value}")
-            record(cmd, "set_normal", True)
-            return True
+    mode = parts[1].lower()
+    tokens = parts[2:]
 
-        if op == "power":
-            if len(parts) != 2 or parts[1] not in ("0", "1"):
-                print("Usage: power 0|1")
-                record(cmd, "set_power", False)
-                return True
-            power.value = (parts[1] == "1")
-            print(f"Primary power present set to {power.value}")
-            record(cmd, "set_power", True)
-            return True
+    if len(tokens) & 1:
+        print("Invalid sensor input: sensor tokens must be pairs")
+        _record(ctx, cmd, "sens_set", False)
+        return True
 
-        # ---------- Sensors ----------
-        if op == "sens":
-            if len(parts) == 2 and parts[1].lower() == "show":
-                print("Sensors:", ", ".join(_fmt_sensor(r) for r in sensors.get_readings()))
-                record(cmd, "sens_show", True)
-                return True
-
-            if len(parts) < 3:
-                print("Usage: sens ok <v> ok <v> ...  OR  sens mix ok <v> fail <v> ...")
-                record(cmd, "sens_set", False)
-                return True
-
-            mode = parts[1].lower()
-            tokens = parts[2:]
-
-            def parse_pairs(tok: list[str]) -> list[tuple[str, float]]:
-                out: list[tuple[str, float]] = []
-                if len(tok) % 2 != 0:
-                    raise ValueError("sensor tokens must be pairs")
-                for i in range(0, len(tok), 2):
-                    out.append((tok[i].lower(), float(tok[i + 1])))
-                return out
-
-            try:
-                pairs = parse_pairs(tokens)
-            except Exception as e:
-                print(f"Invalid sensor input: {e}")
-                record(cmd, "sens_set", False)
-                return True
-
-            new_readings: list[PositionSensorReading] = []
-
-            if mode == "ok":
-                for kind, v in pairs:
-                    if kind != "ok":
-                        print("Mode 'ok' only accepts 'ok <v>' pairs")
-                        record(cmd, "sens_set", False)
-                        return True
-                    new_readings.append(PositionSensorReading(SensorStatus.OK, v))
-
-            elif mode == "mix":
-                for kind, v in pairs:
-                    if kind == "ok":
-                        new_readings.append(PositionSensorReading(SensorStatus.OK, v))
-                    elif kind in ("fail", "failed"):
-                        new_readings.append(PositionSensorReading(SensorStatus.FAILED, v))
-                    else:
-                        print("Mode 'mix' accepts 'ok <v>' and 'fail <v>' pairs")
-                        record(cmd, "sens_set", False)
-                        return True
-            else:
-                print("Usage: sens ok <v> ok <v> ...  OR  sens mix ok <v> fail <v> ...")
-                record(cmd, "sens_set", False)
-                return True
-
-            sensors.set_readings(new_readings)
-            print("Sensors set:", ", ".join(_fmt_sensor(r) for r in sensors.get_readings()))
-            record(cmd, "sens_set", True)
-            return True
+    try:
+        values = list(map(float, tokens[1::2]))
+    except ValueError as e:
+        print(f"Invalid sensor input: {e}")
+        _record(ctx, cmd, "sens_set", False)
+        return True
 
-        # ---------- Diagnostics ----------
-        if op == "state":
-            print(controller.state.name)
-            record(cmd, "query_state", True)
-            return True
+    kinds = list(map(str.lower, tokens[0::2]))
 
-        if op == "status":
-            _print_status(controller, altitude, normal, power, wow, sensors)
-            record(cmd, "status", True)
+    if mode == "ok":
+        if any(k != "ok" for k in kinds):
+            print("Mode 'ok' only accepts 'ok <v>' pairs")
+            _record(ctx, cmd, "sens_set", False)
             return True
-
-        if op == "lat":
-            if len(parts) != 2:
-                print("Usage: lat <fault_code>")
-                record(cmd, "latency", False)
-                return True
-            code = parts[1]
-            if hasattr(controller, "fault_classification_latency_ms"):
-                lat = controller.fault_classification_latency_ms(code)
-                print(f"{code}: {lat} ms")
-                record(cmd, "latency", True)
-            else:
-                print("PR004 latency API not present")
-                record(cmd, "latency", False)
+    elif mode == "mix":
+        if any(k not in _SENSOR_KINDS for k in kinds):
+            print("Mode 'mix' accepts 'ok <v>' and 'fail <v>' pairs")
+            _record(ctx, cmd, "sens_set", False)
             return True
+    else:
+        print(_USAGE_SENS)
+        _record(ctx, cmd, "sens_set", False)
+        return True
 
-        if op == "faults":
-            mf_codes = getattr(controller, "_maintenance_fault_codes", set())
-            rec = getattr(controller, "_recorded_fault_codes", set())
-            print("MaintenanceFaultCodes:", sorted(list(mf_codes)))
-            print("RecordedFaultCodes:", sorted(list(rec)))
-            record(cmd, "faults", True)
-            return True
+    # Built as a tuple so the bank publishes it without another copy
+    sensors.set_readings(tuple(
+        _pooled_reading(_SENSOR_KINDS[k], v) for k, v in zip(kinds, values)
+    ))
+    print("Sensors set:", sensors.get_formatted())
+    _record(ctx, cmd, "sens_set", True)
+    return True
 
-        if op == "reset":
-            _reset_controller(controller)
-            print("Controller reset to RESET state")
-            record(cmd, "reset", True)
-            return True
 
-        print("Unknown command. Type 'help'.")
-        record(cmd, "unknown", False)
+# ---------- Diagnostics ----------
+
+def _cmd_state(ctx: AppContext, parts: list[str], cmd: str) -> bool:
+    print(ctx.controller.state.name)
+    _record(ctx, cmd, "query_state", True)
+    return True
+
+
+def _cmd_status(ctx: AppContext, parts: list[str], cmd: str) -> bool:
+    _print_status(ctx.controller, ctx.env, ctx.sensors)
+    _record(ctx, cmd, "status", True)
+    return True
+
+
+def _cmd_lat(ctx: AppContext, parts: list[str], cmd: str) -> bool:
+    if len(parts) != 2:
+        print("Usage: lat <fault_code>")
+        _record(ctx, cmd, "latency", False)
+        return True
+    code = parts[1]
+    latency_ms = getattr(ctx.controller, "fault_classification_latency_ms", None)
+    if latency_ms is not None:
+        lat = latency_ms(code)
+        print(f"{code}: {lat} ms")
+        _record(ctx, cmd, "latency", True)
+    else:
+        print("PR004 latency API not present")
+        _record(ctx, cmd, "latency", False)
+    return True
+
+
+def _cmd_faults(ctx: AppContext, parts: list[str], cmd: str) -> bool:
+    snap = ctx.controller.snapshot()
+    print("MaintenanceFaultCodes:", snap.maintenance_fault_codes)
+    print("RecordedFaultCodes:", snap.recorded_fault_codes)
+    _record(ctx, cmd, "faults", True)
+    return True
+
+
+def _cmd_reset(ctx: AppContext, parts: list[str], cmd: str) -> bool:
+    _reset_controller(ctx.controller)
+    print("Controller reset to RESET state")
+    _record(ctx, cmd, "reset", True)
+    return True
+
+
+def _cmd_unknown(ctx: AppContext, parts: list[str], cmd: str) -> bool:
+    print("Unknown command. Type 'help'.")
+    _record(ctx, cmd, "unknown", False)
+    return True
+
+
+# Command table: op token -> handler. Each handler returns True to keep the CLI running.
+_HANDLERS: dict[str, Callable[[AppContext, list[str], str], bool]] = {
+    "q": _cmd_quit,
+    "quit": _cmd_quit,
+    "exit": _cmd_quit,
+    "help": _cmd_help,
+    "?": _cmd_help,
+    "run": _cmd_run,
+    "stop": _cmd_stop,
+    "period": _cmd_period,
+    "step": _cmd_step,
+    "d": _cmd_deploy,
+    "u": _cmd_retract,
+    "wow": _cmd_wow,
+    "alt": _cmd_alt,
+    "normal": _cmd_normal,
+    "power": _cmd_power,
+    "sens": _cmd_sens,
+    "state": _cmd_state,
+    "status": _cmd_status,
+    "lat": _cmd_lat,
+    "faults": _cmd_faults,
+    "reset": _cmd_reset,
+}
+
+
+def _dispatch(
+    ctx: AppContext,
+    raw_cmd: str,
+    _lookup=_HANDLERS.get,
+    _intern=sys.intern,
+    _unknown=_cmd_unknown,
+) -> bool:
+    """
+    Executes one CLI command line.
+    Returns True if the CLI should continue running, False to exit.
+    Always records (action, success) for audit.
+    """
+    # Handler lookup, interning and fallback are bound as defaults (local loads per call).
+    cmd = raw_cmd.strip()
+    if not cmd:
         return True
 
+    parts = cmd.split()
+    op = _intern(parts[0].lower())
+
+    return _lookup(op, _unknown)(ctx, parts, cmd)
+
+
+def run_rich_cli(ctx: AppContext) -> int:
+    controller = ctx.controller
+    loop = ctx.loop
+
+    annunciator = StateAnnunciator()
+
+    if ctx.command_recorder is None:
+        raise RuntimeError("CommandRecorder not configured in AppContext")
+
+    # Attach annunicator to loop tick callback
+    loop._on_tick = annunciator 
+    # Announce state immediately
+    annunciator(controller)
+
+    _print_help()
+
+    # Polls stdin so a shutdown signal ends the session without waiting for a keystroke
+    reader = StdinReader(ctx.shutdown_event)
 
     while not ctx.shutdown_event.is_set():
         try:
-            raw = input("> ")
+            raw = reader.readline("> ")
         except (EOFError, KeyboardInterrupt):
             print()
             ctx.shutdown()
             break
 
+        if raw is None:
+            # Shutdown requested while waiting for input
+            print()
+            break
+
         # dispatch handles strip/empty
-        if not dispatch(raw):
+        if not _dispatch(ctx, raw):
             break
 
 if __name__ == "__main__":
@@ -7,10 +7,11 @@ Version: 1.1
 
 Purpose:
 Provides shared support utilities for the LGCS command-line interface and
-simulation environment. This module defines mutable wrapper types for interactive
-inputs, a thread-safe position sensor bank for fault injection and testing, and
+simulation environment. This module defines a mutable environment holder for
+interactive inputs, a thread-safe position sensor bank for fault injection and testing,
 a lightweight control loop abstraction for driving the LandingGearController
-either step-wise or in a background thread.
+either step-wise or in a background thread, and a shutdown-aware stdin line
+reader for the interactive prompt.
 
 Targeted Requirements:
 - None (supporting analysis, simulation, and tooling only)
@@ -27,6 +28,14 @@ It is not flight-certified and must not be used in operational systems.
 
 Dependencies:
 - Python 3.10+
+- collections (standard library)
+- itertools (standard library)
+- logging (standard library)
+- ctypes (standard library, Windows timer resolution and Linux memory locking only)
+- os (standard library)
+- queue (standard library)
+- selectors (standard library)
+- sys (standard library)
 - threading (standard library)
 - time (standard library)
 - dataclasses (standard library)
@@ -44,58 +53,203 @@ They do not represent certified software and must not be used in real-world avia
 or safety-critical systems.
 """
 
+import collections
+import logging
+import os
+import queue
+import selectors
+import sys
 import threading
 import time
 from dataclasses import dataclass
+from itertools import repeat
 from typing import Sequence, Callable, Optional
 
 from landing_gear_controller import LandingGearController
 from sims.position_simulator import PositionSensorReading, SensorStatus
 
 
-@dataclass
-class MutableBool:
-    value: bool = True
+@dataclass(slots=True)
+class Environment:
+    # Interactive environment inputs read by the controller providers and the CLI.
+    altitude: float = 0.0
+    normal: bool = True
+    power: bool = True
+    wow: bool = True
 
 
-@dataclass
-class MutableFloat:
-    value: float = 0.0
+# Display label per sensor status
+_STATUS_NAME = {SensorStatus.OK: "OK", SensorStatus.FAILED: "FAILED"}
+
+
+def _fmt_sensor(r: PositionSensorReading) -> str:
+    return f"{_STATUS_NAME[r.status]}:{r.position_norm:.3f}"
 
 
 class PositionSensorBank:
+    """
+    Sensor readings shared between the CLI (writer) and the control loop (reader).
+
+    Readings are published as an immutable tuple by a single attribute store,
+    which is atomic in CPython, so readers take no lock and never see a partial
+    update. Assumes a single writer (the CLI thread).
+    """
+
     def __init__(self):
-        self._readings: list[PositionSensorReading] = [
+        self._readings: tuple[PositionSensorReading, ...] = (
             PositionSensorReading(SensorStatus.OK, 0.0),
             PositionSensorReading(SensorStatus.OK, 0.0),
-        ]
-        self._lock = threading.Lock()
+        )
+        # (readings tuple, formatted string); rebuilt when the published tuple changes
+        self._fmt_cache: tuple[tuple[PositionSensorReading, ...], str] | None = None
 
     def set_readings(self, readings: Sequence[PositionSensorReading]) -> None:
-        with self._lock:
-            self._readings = list(readings)
+        self._readings = tuple(readings)
 
     def get_readings(self) -> Sequence[PositionSensorReading]:
-        with self._lock:
-            return list(self._readings)
+        return self._readings
+
+    def get_formatted(self) -> str:
+        readings = self._readings
+        cached = self._fmt_cache
+        if cached is None or cached[0] is not readings:
+            cached = (readings, ", ".join(_fmt_sensor(r) for r in readings))
+            self._fmt_cache = cached
+        return cached[1]
+
+
+# Hybrid wait tuning: initial overshoot estimate and cap on the final spin-wait per tick
+_INITIAL_SLEEP_OVERSHOOT_S = 0.002
+_MAX_SPIN_S = 0.005
+
+
+def _set_windows_timer_resolution(enable: bool) -> None:
+    # Request 1 ms scheduler resolution on Windows while the loop runs (no-op elsewhere).
+    if sys.platform != "win32":
+        return
+    try:
+        import ctypes
+        winmm = ctypes.windll.winmm
+        if enable:
+            winmm.timeBeginPeriod(1)
+        else:
+            winmm.timeEndPeriod(1)
+    except Exception:
+        pass
+
+
+def _pin_current_thread(cpu: int) -> None:
+    # Best effort: pin the calling thread to one CPU. Scheduling policy is left alone
+    # (see _raise_thread_priority). Failures leave the thread unchanged.
+    if sys.platform == "win32":
+        try:
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            kernel32.SetThreadAffinityMask(kernel32.GetCurrentThread(), 1 << cpu)
+        except Exception:
+            pass
+        return
+
+    try:
+        os.sched_setaffinity(0, {cpu})  # pid 0 = calling thread on Linux
+    except (AttributeError, OSError, ValueError):
+        pass
+
+
+def _raise_thread_priority() -> None:
+    # Best effort: move the calling thread to a real-time scheduling class (SCHED_FIFO at
+    # its lowest priority on Linux). A thread in this class is never preempted by normal
+    # tasks, so it must not busy-wait; ControlLoop disables its spin phase when it asks for this.
+    # Failures (unsupported platform, insufficient privilege) leave the thread unchanged.
+    if sys.platform == "win32":
+        try:
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            kernel32.SetThreadPriority(kernel32.GetCurrentThread(), 2)  # THREAD_PRIORITY_HIGHEST
+        except Exception:
+            pass
+        return
+
+    try:
+        policy = os.SCHED_FIFO
+        os.sched_setscheduler(0, policy, os.sched_param(os.sched_get_priority_min(policy)))
+    except (AttributeError, OSError):
+        pass
+
+
+# mlockall() flag from <sys/mman.h>: lock every page currently mapped
+_MCL_CURRENT = 1
+
+
+def _load_libc():
+    # The C library (for mlockall/munlockall), or None where memory locking is unsupported.
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        import ctypes
+        return ctypes.CDLL(None, use_errno=True)
+    except OSError:
+        return None
+
+
+def _lock_process_memory() -> bool:
+    # Lock the pages mapped so far (controller, loop thread stack, interpreter) into RAM so
+    # the loop takes no page-in faults. MCL_FUTURE is deliberately not requested: under a
+    # finite RLIMIT_MEMLOCK it turns later allocations into MemoryError.
+    # Returns False, with a warning logged, if locking is unsupported or not permitted.
+    libc = _load_libc()
+    if libc is None:
+        logging.warning("Memory locking not supported on this platform")
+        return False
+    if libc.mlockall(_MCL_CURRENT) != 0:
+        import ctypes
+        logging.warning("mlockall failed: %s", os.strerror(ctypes.get_errno()))
+        return False
+    return True
+
+
+def _unlock_process_memory() -> None:
+    libc = _load_libc()
+    if libc is not None:
+        libc.munlockall()
 
 
 class ControlLoop:
     def __init__(self, 
                  controller: LandingGearController, 
                  period_s: float = 0.1,
-                 on_tick: Optional[Callable] = None,):
+                 on_tick: Optional[Callable] = None,
+                 pin_cpu: Optional[int] = None,
+                 lock_memory: bool = False,
+                 realtime: bool = False,):
         self._controller = controller
         self._period_s = float(period_s)
         self._on_tick = on_tick
+        # Optional CPU to pin the background loop thread to (affinity only)
+        self._pin_cpu = pin_cpu
+        # Real-time scheduling for the loop thread; opt-in, and turns off the spin phase of the wait
+        self._realtime = bool(realtime)
+        # Lock process memory (mlockall) while the background loop runs; opt-in
+        self._lock_memory = bool(lock_memory)
+        self._memory_locked = False
         self._running = False
+        # Plain flag for the per-tick stop checks; the event only exists to cut a wait short.
+        self._stop = False
         self._stop_evt = threading.Event()
         self._thread: threading.Thread | None = None
 
+        # Observed wait overshoot (s) over recent ticks; the worst case sets the spin window
+        self._sleep_overshoot_samples: collections.deque[float] = collections.deque(maxlen=64)
+        self._sleep_worst_overshoot_s = _INITIAL_SLEEP_OVERSHOOT_S
+
     @property
     def period_s(self) -> float:
         return self._period_s
 
+    @property
+    def memory_locked(self) -> bool:
+        return self._memory_locked
+
     def set_period(self, period_s: float) -> None:
         self._period_s = max(0.01, float(period_s))
 
@@ -103,28 +257,193 @@ class ControlLoop:
         if self._running:
             return
         self._running = True
+        self._stop = False
         self._stop_evt.clear()
+        _set_windows_timer_resolution(True)
         self._thread = threading.Thread(target=self._run, daemon=True)
         self._thread.start()
 
     def stop(self) -> None:
         if not self._running:
             return
+        self._stop = True
         self._stop_evt.set()
         if self._thread is not None:
             self._thread.join(timeout=1.0)
+        if self._memory_locked:
+            _unlock_process_memory()
+            self._memory_locked = False
+        _set_windows_timer_resolution(False)
         self._running = False
         self._thread = None
 
     def step(self, n: int = 1) -> None:
-        for _ in range(max(1, int(n))):
-            self._controller.update()
-            if self._on_tick:
-                self._on_tick(self._controller)
+        # Bind the per-tick callables once rather than re-resolving them every tick.
+        controller = self._controller
+        update = controller.update
+        on_tick = self._on_tick
+        ticks = repeat(None, max(1, int(n)))
+        if not on_tick:
+            # No per-tick callback: keep the loop body to the update call alone
+            for _ in ticks:
+                update()
+            return
+        for _ in ticks:
+            update()
+            on_tick(controller)
 
     def _run(self) -> None:
-        while not self._stop_evt.is_set():
-            self._controller.update()
-            if self._on_tick:
-                self._on_tick(self._controller)
-            time.sleep(self._period_s)
+        if self._pin_cpu is not None:
+            _pin_current_thread(self._pin_cpu)
+        if self._realtime:
+            _raise_thread_priority()
+        if self._lock_memory:
+            # Locked from the loop thread so its stack is already mapped
+            self._memory_locked = _lock_process_memory()
+
+        controller = self._controller
+        update = controller.update
+        on_tick = self._on_tick
+        wait_until = self._wait_until
+        monotonic = time.monotonic
+
+        # Absolute-deadline scheduling: tick N is due at start + N * period, so the
+        # update's own runtime and wake-up jitter do not accumulate as drift.
+        # The first tick runs immediately; every later tick runs after a wait whose
+        # result doubles as the stop check.
+        next_deadline = monotonic()
+        while True:
+            update()
+            if on_tick:
+                on_tick(controller)
+
+            # Period is re-read each tick so set_period() applies to a running loop.
+            period_s = self._period_s
+            next_deadline += period_s
+            delay = next_deadline - monotonic()
+            if delay > 0:
+                if wait_until(next_deadline):
+                    return
+                continue
+
+            if delay < -period_s:
+                # Overran by more than a whole period: resynchronise instead of bursting to catch up
+                next_deadline = monotonic()
+            if self._stop:
+                return
+
+    def _wait_until(self, deadline: float) -> bool:
+        # Hybrid wait: block on the stop event for all but the learned worst-case wake-up
+        # overshoot, then spin on the clock for the final gap. Returns True if stop() was
+        # requested during the wait (the stop event is seen immediately, not after the period).
+        # A real-time thread blocks for the whole delay instead: spinning at SCHED_FIFO would
+        # starve every normal task on its CPU.
+        clock = time.monotonic
+        if self._realtime:
+            return self._stop_evt.wait(max(0.0, deadline - clock())) or self._stop
+        spin_s = min(self._sleep_worst_overshoot_s, _MAX_SPIN_S)
+
+        coarse_s = deadline - clock() - spin_s
+        if coarse_s > 0:
+            t0 = clock()
+            if self._stop_evt.wait(coarse_s):
+                return True
+            samples = self._sleep_overshoot_samples
+            samples.append(max(0.0, clock() - t0 - coarse_s))
+            self._sleep_worst_overshoot_s = max(samples)
+
+        while clock() < deadline:
+            pass
+        return self._stop
+
+
+class StdinReader:
+    """
+    Line reader for the interactive prompt that does not block shutdown.
+
+    On POSIX the stdin file descriptor is polled with a selector, so a
+    shutdown requested from another thread (or a signal handler) is noticed
+    within one poll interval. Elsewhere, or when the stream has no pollable
+    file descriptor (no fileno(), or stdin redirected from a regular file),
+    a daemon thread reads lines into a queue that is polled the same way.
+    """
+
+    def __init__(self, shutdown_event: threading.Event, stream=None, poll_s: float = 0.1):
+        self._shutdown_event = shutdown_event
+        self._stream = stream if stream is not None else sys.stdin
+        self._poll_s = float(poll_s)
+        self._encoding = getattr(self._stream, "encoding", None) or "utf-8"
+
+        self._buf = b""
+        self._eof = False
+        self._selector: selectors.BaseSelector | None = None
+        self._queue: queue.SimpleQueue[str] | None = None
+
+        try:
+            self._fd: int | None = self._stream.fileno()
+        except (AttributeError, OSError, ValueError):
+            self._fd = None
+
+        if self._fd is not None and os.name == "posix":
+            selector = selectors.DefaultSelector()
+            try:
+                selector.register(self._fd, selectors.EVENT_READ)
+                self._selector = selector
+            except (PermissionError, OSError, ValueError):
+                # epoll rejects regular files and /dev/null (redirected stdin): use the reader thread
+                selector.close()
+
+        if self._selector is None:
+            self._queue = queue.SimpleQueue()
+            threading.Thread(target=self._pump, daemon=True).start()
+
+    def readline(self, prompt: str = "") -> str | None:
+        # Returns the next line without its newline, or None once shutdown is requested.
+        # Raises EOFError at end of input, mirroring input().
+        if prompt:
+            sys.stdout.write(prompt)
+            sys.stdout.flush()
+
+        while not self._shutdown_event.is_set():
+            line = self._poll_line()
+            if line is None:
+                continue
+            if line == "":
+                raise EOFError
+            return line.rstrip("\r\n")
+        return None
+
+    def _poll_line(self) -> str | None:
+        # One poll interval: a line, "" at EOF, or None if nothing complete arrived yet.
+        if self._queue is not None:
+            try:
+                return self._queue.get(timeout=self._poll_s)
+            except queue.Empty:
+                return None
+
+        if b"\n" not in self._buf and not self._eof:
+            if not self._selector.select(self._poll_s):
+                return None
+            chunk = os.read(self._fd, 4096)
+            if chunk:
+                self._buf += chunk
+            else:
+                self._eof = True
+
+        if b"\n" in self._buf:
+            line, _, self._buf = self._buf.partition(b"\n")
+            return line.decode(self._encoding, errors="replace") + "\n"
+
+        if self._eof:
+            # Flush a trailing unterminated line first; an empty result then signals EOF.
+            line, self._buf = self._buf, b""
+            return line.decode(self._encoding, errors="replace")
+
+        return None
+
+    def _pump(self) -> None:
+        while True:
+            line = self._stream.readline()
+            self._queue.put(line)
+            if not line:
+                return
@@ -4,7 +4,10 @@ from __future__ import annotations
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable
-import threading
+import os
+import weakref
+
+from log_writer import LogWriter
 
 
 @dataclass
@@ -13,7 +16,6 @@ class CommandRecorder:
     clock: Callable[[], float]
 
     def __post_init__(self) -> None:
-        self._lock = threading.Lock()
         self.filepath.parent.mkdir(parents=True, exist_ok=True)
 
         # Optional: write header once
@@ -21,6 +23,11 @@ class CommandRecorder:
             with self.filepath.open("w", encoding="utf-8") as f:
                 f.write("timestamp,command,action,success\n")
 
+        # Opened once and handed to a background writer; record() only enqueues.
+        self._fh = self.filepath.open("a", encoding="utf-8", buffering=1 << 16)
+        self._writer = LogWriter(self._fh)
+        self._finalizer = weakref.finalize(self, self._writer.close)
+
     def record(
         self,
         *,
@@ -28,10 +35,20 @@ class CommandRecorder:
         action: str,
         success: bool,
     ) -> None:
+        # command is already stripped by the CLI at parse time; only embedded line breaks
+        # (stray operator input) are escaped so each record stays on one line.
+        if "\n" in command or "\r" in command:
+            command = command.replace("\r", "\\r").replace("\n", "\\n")
         ts = self.clock()
-        line = f"{ts:.6f},{command.strip()},{action},{success}\n"
+        line = "%.6f,%s,%s,%s\n" % (ts, command, action, success)
+
+        self._writer.write(line)
+
+    def sync(self) -> None:
+        # Waits for queued lines to be written, then pushes them to disk.
+        self._writer.flush()
+        if not self._fh.closed:
+            os.fsync(self._fh.fileno())
 
-        with self._lock:
-            with self.filepath.open("a", encoding="utf-8") as f:
-                f.write(line)
-                f.flush()
+    def close(self) -> None:
+        self._finalizer()
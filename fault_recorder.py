@@ -14,7 +14,8 @@ Targeted Requirements:
 - None (supporting analysis or tooling only)
 
 Scope and Limitations:
-- Fault persistence is file-based and append-only
+- Fault persistence is file-based and append-only, through a single
+  long-lived O_APPEND file descriptor; each record is one os.write call
 - No fault de-duplication, severity classification, or rollover handling
 - Assumes reliable filesystem access
 - Intended for simulation, testing, and academic analysis only
@@ -26,8 +27,11 @@ It is not flight-certified and must not be used in operational systems.
 Dependencies:
 - Python 3.10+
 - dataclasses (standard library)
+- os (standard library)
 - pathlib (standard library)
+- threading (standard library)
 - typing (standard library)
+- weakref (standard library)
 
 Related Documents:
 - LGCS Requirements Specification
@@ -41,6 +45,9 @@ or safety-critical systems.
 
 # fault_recorder.py
 
+import os
+import threading
+import weakref
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable
@@ -61,12 +68,28 @@ class FaultRecorder:
         if self._path.parent:
             self._path.parent.mkdir(parents=True, exist_ok=True)
 
+        # Raw append-only descriptor, opened once and kept for the recorder's lifetime.
+        # Each record is a single os.write, so there is no userspace buffer to flush.
+        # The finalizer closes it on garbage collection or interpreter exit.
+        self._fd = os.open(self._path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        self._finalizer = weakref.finalize(self, os.close, self._fd)
+        # Only guards close() against an in-flight write (a closed fd number can be reused)
+        self._lock = threading.Lock()
+
     def record(self, fault_code: str) -> FaultRecord:
         # Records a fault code with timestamp to non-volatile storage (append-only).
         ts = float(self._clock())
         rec = FaultRecord(timestamp_s=ts, fault_code=str(fault_code))
 
-        line = f"{rec.timestamp_s:.6f},{rec.fault_code}\n"
-        self._path.open("a", encoding="utf-8").write(line)
+        line = b"%.6f,%s\n" % (ts, rec.fault_code.encode("utf-8"))
+        with self._lock:
+            if not self._finalizer.alive:
+                raise ValueError("FaultRecorder is closed")
+            # FTHR003: the line is handed to the OS before record() returns
+            os.write(self._fd, line)
 
         return rec
+
+    def close(self) -> None:
+        with self._lock:
+            self._finalizer()
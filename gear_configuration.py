@@ -41,10 +41,17 @@ They do not represent certified software and must not be used in real-world avia
 or safety-critical systems.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 
-@dataclass(frozen=True)
-class GearConfiguration:
+
+class _DerivedDeployTime:
+    # Slots for the values GearConfiguration derives in __post_init__. Declared on a base
+    # class so they stay out of the dataclass fields (fields(), asdict(), replace()).
+    __slots__ = ("_deploy_time_ms", "_deploy_time_s")
+
+
+@dataclass(frozen=True, slots=True)
+class GearConfiguration(_DerivedDeployTime):
     # Immutable landing gear hardware configuration.
     name: str
     pump_latency_ms: int
@@ -53,7 +60,7 @@ class GearConfiguration:
     lock_time_ms: int
     requirement_time_ms: int
 
-    def compute_deploy_time_ms(self) -> float:
+    def __post_init__(self) -> None:
         # Worst-case theoretical deploy time.
         # Pure calculation, no side effects.
         actuator_speed_mm_per_ms = self.actuator_speed_mm_per_100ms / 100.0
@@ -62,17 +69,24 @@ class GearConfiguration:
             self.extension_distance_mm / actuator_speed_mm_per_ms
         )
 
-        return (
-            self.pump_latency_ms +
-            extension_time_ms +
-            self.lock_time_ms
-        )
-    
-    def meets_deploy_requirement(self) -> bool:
-        return self.compute_deploy_time_ms() <= self.requirement_time_ms
-    
-    
+        deploy_time_ms = self.pump_latency_ms + extension_time_ms + self.lock_time_ms
+        # Derived once at construction; the inputs are frozen so they can never go stale.
+        object.__setattr__(self, "_deploy_time_ms", deploy_time_ms)
+        object.__setattr__(self, "_deploy_time_s", deploy_time_ms / 1000.0)
 
+    def __setstate__(self, state) -> None:
+        # Unpickling/copying restores only the fields; re-derive the deploy times.
+        for f, value in zip(fields(self), state):
+            object.__setattr__(self, f.name, value)
+        self.__post_init__()
 
+    @property
+    def deploy_time_s(self) -> float:
+        # Worst-case deploy time in seconds, as compared against elapsed clock time.
+        return self._deploy_time_s
 
+    def compute_deploy_time_ms(self) -> float:
+        return self._deploy_time_ms
     
+    def meets_deploy_requirement(self) -> bool:
+        return self._deploy_time_ms <= self.requirement_time_ms
@@ -42,9 +42,10 @@ They do not represent certified software and must not be used in real-world avia
 or safety-critical systems.
 """
 
-from enum import Enum, auto
+from enum import Enum, IntEnum, auto
 
-class GearState(Enum):
+# IntEnum: state comparisons, hashing and dict lookups run as plain int operations.
+class GearState(IntEnum):
     RESET = auto()
     UP_LOCKED = auto()
     TRANSITIONING_DOWN = auto()
@@ -52,4 +53,11 @@ class GearState(Enum):
     TRANSITIONING_UP = auto()
     FAULT = auto()
     ABNORMAL = auto()
+
+    def __str__(self) -> str:
+        # Status output shows the state name, not IntEnum's bare integer.
+        return self.name
+
+    # Enum's formatter honours __str__ (IntEnum's formats the integer, even with a spec)
+    __format__ = Enum.__format__
     
\ No newline at end of file
@@ -38,6 +38,10 @@ Scope and Limitations:
 - FAULT and ABNORMAL states are treated as actuator-inhibited safe states.
 - RESET-state sensor determination uses a simple position threshold policy; ambiguous readings
   remain RESET (FTHR004), inhibiting command acceptance until validated.
+- Messages are emitted on the module logger: warnings and command rejections at WARNING
+  (shown even without logging configuration), other messages at INFO (shown only when
+  a handler is configured, as main.setup_logging() does). Subclasses overriding log()
+  must accept the level argument.
 - Intended for simulation, design exploration, and requirements validation only.
 
 Safety Notice:
@@ -114,7 +118,9 @@ It is not flight-certified and must not be used in operational systems.
 #       * LGCS-FR001 (UP -> DOWN within required time under valid deploy command).
 
 
+import logging
 import time
+from dataclasses import dataclass
 from typing import Callable, Sequence
 import math
 
@@ -123,7 +129,139 @@ from gear_states import GearState
 from sims.position_simulator import PositionSensorReading, SensorStatus
 
 
+# Operator-facing controller messages. The application attaches a stdout
+# handler (see main.setup_logging); unconfigured, INFO messages are discarded.
+_logger = logging.getLogger(__name__)
+
+# States in which transition commands are ignored and actuators are held off (FR004).
+_INHIBIT_STATES = frozenset({GearState.FAULT, GearState.ABNORMAL})
+# Gear already down or on its way down (SR001/SR002/SR004 take no further action).
+_DOWN_STATES = frozenset({GearState.DOWN_LOCKED, GearState.TRANSITIONING_DOWN})
+# Gear in motion (PR002 cadence limit applies instead of PR003).
+_TRANSITION_STATES = frozenset({GearState.TRANSITIONING_DOWN, GearState.TRANSITIONING_UP})
+
+# Bit for each fault code in the recorded-fault mask; lets the per-tick FTHR001 path skip
+# re-raising faults that are already recorded with one integer test.
+_FAULT_BITS = {
+    "FTHR001_SINGLE_SENSOR_FAILURE": 1,
+    "MULTIPLE_SENSOR_FAILURE": 2,
+    "FTHR002_SENSOR_CONFLICT_PERSISTENT": 4,
+}
+_FTHR001_BIT = _FAULT_BITS["FTHR001_SINGLE_SENSOR_FAILURE"]
+_SENSOR_FAILURE_BITS = _FTHR001_BIT | _FAULT_BITS["MULTIPLE_SENSOR_FAILURE"]
+
+# Summary of a sample with no valid sensors: (count, sum, min, max).
+_NO_VALID_READINGS = (0, 0.0, math.inf, -math.inf)
+
+
+def _summarise_readings(readings) -> tuple[int, float, float, float]:
+    # One pass over a sensor sample, accumulating count, sum, min and max of the valid
+    # positions (OK status and finite: the FTHR001/002/004 validity rule).
+    n = 0
+    total = 0.0
+    lo = math.inf
+    hi = -math.inf
+    ok = SensorStatus.OK
+    isfinite = math.isfinite
+    for r in readings:
+        if r.status is ok:
+            p = float(r.position_norm)
+            if isfinite(p):
+                n += 1
+                total += p
+                if p < lo:
+                    lo = p
+                if p > hi:
+                    hi = p
+    return n, total, lo, hi
+
+
+# Command rejection messages, built once per state rather than formatted per rejection.
+_DEPLOY_REJECTED_MSG = {s: f"Deploy rejected: state={s.name}" for s in GearState}
+_RETRACT_REJECTED_MSG = {s: f"Retract rejected: state={s.name}" for s in GearState}
+# Fixed operator messages.
+_LOW_ALT_WARNING_MSG = "WARNING: ALTITUDE LOW - LANDING GEAR NOT DEPLOYED"
+_AURAL_WARNING_MSG = "AURAL WARNING: GEAR"
+_RETRACT_WOW_INHIBITED_MSG = "Retract inhibited: weight-on-wheels=TRUE"
+_DEPLOY_IN_RESET_MSG = "Deploy rejected: system in RESET state"
+_RETRACT_IN_RESET_MSG = "Retract rejected: system in RESET state"
+_RETRACT_NO_POWER_MSG = "Retract rejected: primary control power not present"
+_RETRACT_WOW_REJECTED_MSG = "Retract rejected: weight-on-wheels=TRUE"
+# Actuator edge messages, keyed by the commanded value.
+_GEAR_DOWN_CMD_MSG = {b: f"Gear down actuator command: {b}" for b in (True, False)}
+_GEAR_UP_CMD_MSG = {b: f"Gear up actuator command: {b}" for b in (True, False)}
+
+
+@dataclass(slots=True)
+class DiagnosticsSnapshot:
+    # Point-in-time copy of controller diagnostics for CLI/status presentation.
+    state: GearState
+    position_estimate_norm: float | None
+    maintenance_fault_active: bool
+    maintenance_fault_codes: list[str]
+    recorded_fault_codes: list[str]
+    fault_classified_codes: list[str]
+    sensor_conflict_started_at: float | None
+    sensor_conflict_fault_latched: bool
+
+
 class LandingGearController:
+    # Every attribute lives in a slot. The only per-instance override callers make,
+    # ``controller.log = fn``, goes through the log property into _log_hook.
+    __slots__ = (
+        "_altitude_provider",
+        "_auto_deploy_latched",
+        "_clock",
+        "_config",
+        "_deploy_actuation_stamp_armed",
+        "_deploy_actuation_ts",
+        "_deploy_cmd_ts",
+        "_deploy_latency_ms_latched",
+        "_deploy_requested",
+        "_deploy_time_s",
+        "_deploy_transition_ts",
+        "_fault_classification_latency_threshold_s",
+        "_fault_classified_ts",
+        "_fault_occurrence_ts",
+        "_fault_recorder",
+        "_has_alt",
+        "_last_gear_down_cmd",
+        "_last_gear_up_cmd",
+        "_last_update_ts",
+        "_log_hook",
+        "_low_alt_warning_active",
+        "_maintenance_fault_active",
+        "_maintenance_fault_codes",
+        "_normal_conditions_provider",
+        "_position_estimate_norm",
+        "_position_sensors_provider",
+        "_pr002_transition_max_dt_s",
+        "_pr003_steady_max_dt_s",
+        "_recorded_fault_codes",
+        "_recorded_fault_mask",
+        "_reset_validated",
+        "_retract_actuation_ts",
+        "_retract_cmd_ts",
+        "_retract_requested",
+        "_retract_transition_ts",
+        "_sensor_conflict_fault_latched",
+        "_sensor_conflict_persist_s",
+        "_sensor_conflict_started_at",
+        "_sensor_conflict_tolerance_norm",
+        "_sr004_power_loss_latched",
+        "_state",
+        "_state_deadline",
+        "_state_entered_at",
+        "_state_handlers",
+        "_tick_sensor_summary",
+        "_steady_dt_violations_s",
+        "_transition_dt_violations_s",
+        "_weight_on_wheels",
+        "fault_classification_latency_s_threshold",
+        "primary_power_present_provider",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         config: GearConfiguration,
@@ -134,6 +272,7 @@ class LandingGearController:
         position_sensors_provider=None,
         fault_recorder=None,
     ):
+        self._log_hook = None
         self._config = config
         self._position_sensors_provider = position_sensors_provider
         # Default boot policy (to satisfy PR003 + enable PR002 deploy):
@@ -148,10 +287,13 @@ class LandingGearController:
 
         self._clock = clock
         self._state_entered_at = self._clock()
+        # Absolute completion time for TRANSITIONING_* states (inf in untimed states)
+        self._state_deadline = math.inf
 
-        # Altitude instrumentation
-        self.altitude_provider = altitude_provider
-        self.normal_conditions_provider = normal_conditions_provider
+        # Altitude instrumentation (setters keep _has_alt in step with the wiring)
+        self._altitude_provider = altitude_provider
+        self._normal_conditions_provider = normal_conditions_provider
+        self._has_alt = altitude_provider is not None and normal_conditions_provider is not None
 
         # Auto-deploy latch for SR001
         self._auto_deploy_latched = False
@@ -170,7 +312,7 @@ class LandingGearController:
         self._retract_transition_ts: float | None = None # TIme at which actuator is energised
         self._retract_actuation_ts: float | None = None # Time at which mechanical motion starts
 
-        self._deploy_time_s = self._config.compute_deploy_time_ms() / 1000.0
+        self._deploy_time_s = self._config.deploy_time_s
 
         # PR001: Arm stamping of deploy actuation timestamp on the first update tick after a deploy command
         self._deploy_actuation_stamp_armed: bool = False
@@ -189,10 +331,14 @@ class LandingGearController:
 
         # Position estimate from sensor data
         self._position_estimate_norm: float | None = None
+        # (count, sum, min, max) of the valid sensor positions sampled by the current update() tick
+        self._tick_sensor_summary: tuple[int, float, float, float] = _NO_VALID_READINGS
 
         # Fault recorder
         self._fault_recorder = fault_recorder
         self._recorded_fault_codes: set[str] = set()
+        # _FAULT_BITS of the codes in _recorded_fault_codes
+        self._recorded_fault_mask = 0
 
         # FTHR002: sensor conflict persistence tracking
         self._sensor_conflict_started_at: float | None = None
@@ -224,6 +370,17 @@ class LandingGearController:
         self._pr002_transition_max_dt_s: float = 0.1   # 10 Hz => dt <= 0.1s passes
         self._pr003_steady_max_dt_s: float = 0.25      # 4 Hz  => dt <= 0.25s passes
 
+        # Per-state tick handlers, one entry for every GearState
+        self._state_handlers = {
+            GearState.FAULT: self._update_halted,
+            GearState.ABNORMAL: self._update_halted,
+            GearState.RESET: self._update_reset,
+            GearState.UP_LOCKED: self._update_up_locked,
+            GearState.TRANSITIONING_DOWN: self._update_transitioning_down,
+            GearState.DOWN_LOCKED: self._update_down_locked,
+            GearState.TRANSITIONING_UP: self._update_transitioning_up,
+        }
+
     # -------------------------
     # Properties / small helpers
     # -------------------------
@@ -244,6 +401,24 @@ class LandingGearController:
     def fault_recorder(self, recorder) -> None:
         self._fault_recorder = recorder
 
+    @property
+    def altitude_provider(self):
+        return self._altitude_provider
+
+    @altitude_provider.setter
+    def altitude_provider(self, provider) -> None:
+        self._altitude_provider = provider
+        self._has_alt = provider is not None and self._normal_conditions_provider is not None
+
+    @property
+    def normal_conditions_provider(self):
+        return self._normal_conditions_provider
+
+    @normal_conditions_provider.setter
+    def normal_conditions_provider(self, provider) -> None:
+        self._normal_conditions_provider = provider
+        self._has_alt = self._altitude_provider is not None and provider is not None
+
     @property
     def position_sensors_provider(self):
         return self._position_sensors_provider
@@ -255,13 +430,41 @@ class LandingGearController:
         self._state = GearState.RESET
         self._reset_validated = False
         self._state_entered_at = self._clock()
+        self._state_deadline = math.inf
         # reset conflict tracking
         self._sensor_conflict_started_at = None
         self._sensor_conflict_fault_latched = False
 
 
-    def log(self, msg: str) -> None:
-        print(msg)
+    def snapshot(self) -> DiagnosticsSnapshot:
+        # Read all diagnostic fields in one place (code lists are sorted copies).
+        return DiagnosticsSnapshot(
+            state=self._state,
+            position_estimate_norm=self._position_estimate_norm,
+            maintenance_fault_active=self._maintenance_fault_active,
+            maintenance_fault_codes=sorted(self._maintenance_fault_codes),
+            recorded_fault_codes=sorted(self._recorded_fault_codes),
+            fault_classified_codes=sorted(self._fault_classified_ts),
+            sensor_conflict_started_at=self._sensor_conflict_started_at,
+            sensor_conflict_fault_latched=self._sensor_conflict_fault_latched,
+        )
+
+    @property
+    def log(self) -> Callable[..., None]:
+        # Log sink called as log(msg, level). An instance can swap in its own sink by
+        # assigning to this property; subclasses override it with a plain method.
+        hook = self._log_hook
+        return self._log_to_logger if hook is None else hook
+
+    @log.setter
+    def log(self, hook: Callable[..., None] | None) -> None:
+        self._log_hook = hook
+
+    def _log_to_logger(self, msg: str, level: int = logging.INFO) -> None:
+        # Callers pass WARNING for warnings and rejections, so Python's last-resort handler
+        # still shows them when no logging is configured; INFO needs a handler
+        # (main.setup_logging() installs one on stdout).
+        _logger.log(level, msg)
 
     def set_weight_on_wheels(self, wow: bool) -> None:
         self._weight_on_wheels = bool(wow)
@@ -269,9 +472,25 @@ class LandingGearController:
     def weight_on_wheels(self) -> bool:
         return self._weight_on_wheels
 
-    def enter_state(self, new_state: GearState) -> None:
+    def enter_state(self, new_state: GearState, now: float | None = None) -> None:
+        # now: timestamp already read by the caller this tick (avoids a second clock read)
+        if now is None:
+            now = self._clock()
         self._state = new_state
-        self._state_entered_at = self._clock()
+        self._state_entered_at = now
+        # Transitions complete at a fixed deadline, so the tick only compares against it
+        self._state_deadline = now + self._deploy_time_s if new_state in _TRANSITION_STATES else math.inf
+        if new_state is GearState.FAULT:
+            # FTHR002 is not evaluated in FAULT, so don't leave its timer running in diagnostics
+            self._sensor_conflict_started_at = None
+
+    def reset_latches(self) -> None:
+        # Clears SR001/SR002/SR004 latches and FTHR002 conflict tracking (operator reset).
+        self._auto_deploy_latched = False
+        self._low_alt_warning_active = False
+        self._sr004_power_loss_latched = False
+        self._sensor_conflict_started_at = None
+        self._sensor_conflict_fault_latched = False
 
     def down_requested(self) -> bool:
         return self._deploy_requested
@@ -358,145 +577,138 @@ class LandingGearController:
         # --- PR002/PR003: cadence monitoring ---
         self._check_update_cadence(now)
 
-        self._apply_fthr002_conflicting_position_sensors_fault()
-
-        # Once in FAULT/ABNORMAL, stop early
-        if self._state in (GearState.FAULT, GearState.ABNORMAL):
-            self._actuate_down(False)
-            self._actuate_up(False)
+        # Once in FAULT, only hold the actuators off: it is left by an operator reset (which
+        # also clears FTHR002 tracking), so sensors are not sampled. ABNORMAL still runs
+        # FTHR002 below, since a persistent conflict escalates it to FAULT.
+        if self._state is GearState.FAULT:
+            self._update_halted(now)
             return
 
-        self._apply_sr004_power_loss_default_down()
-        self._position_estimate_norm = self._apply_fthr001_single_sensor_failure_handling()
-        self._deliver_low_altitude_warning()
-        self._apply_sr001_auto_deploy()
-
-        # Check if any of those tests caused fault/abnormal, stop early
-        if self._state in (GearState.FAULT, GearState.ABNORMAL):
-            self._actuate_down(False)
-            self._actuate_up(False)
+        # Position sensors are sampled and summarised once per tick; FTHR002, FTHR001 and the
+        # RESET-state FTHR004 check all work from the same sample
+        sensors_provider = self._position_sensors_provider
+        readings = sensors_provider() if sensors_provider is not None else None
+        summary = _summarise_readings(readings) if readings else _NO_VALID_READINGS
+        self._tick_sensor_summary = summary
+
+        self._apply_fthr002_conflicting_position_sensors_fault(readings, summary, now)
+        # ABNORMAL, or FTHR002 latched a fault this tick: no further checks
+        if self._state in _INHIBIT_STATES:
+            self._update_halted(now)
             return
 
-        if self._state == GearState.RESET:
-            determined = self._determine_state_from_sensors()
-
-            if determined is None:
-                # FTHR004: remain RESET until sensors can validate a state
-                self.log("RESET: sensors invalid, remaining in RESET")
-                self._reset_validated = False
-                return
+        # Unwired inputs are skipped here, without entering the SR helpers
+        power_provider = self.primary_power_present_provider
+        if power_provider is not None:
+            self._apply_sr004_power_loss_default_down(power_provider, now)
+        self._position_estimate_norm = self._apply_fthr001_single_sensor_failure_handling(readings, summary, now)
+        if self._has_alt:
+            # Each altitude input is sampled once per tick and shared by SR002 and SR001
+            altitude_ft = self._altitude_provider()
+            normal = self._normal_conditions_provider()
+            self._deliver_low_altitude_warning(altitude_ft, normal)
+            self._apply_sr001_auto_deploy(altitude_ft, normal, now)
+
+        # One lookup selects the per-state tick handler (including FAULT/ABNORMAL if
+        # one of the checks above just latched it)
+        self._state_handlers[self._state](now)
+
+    def _update_halted(self, now: float) -> None:
+        # FAULT/ABNORMAL: keep both actuators de-energised
+        self._actuate_down(False)
+        self._actuate_up(False)
 
-            self.enter_state(determined)
-            self._reset_validated = True
-            return
+    def _update_reset(self, now: float) -> None:
+        determined = self._determine_state_from_sensors(self._tick_sensor_summary)
 
-        if self._state == GearState.UP_LOCKED:
-            if self.down_requested():
-                self.command_gear_down(True)
+        if determined is None:
+            # FTHR004: remain RESET until sensors can validate a state
+            if __debug__:  # per-tick diagnostic; compiled out under python -O
+                self.log("RESET: sensors invalid, remaining in RESET")
+            self._reset_validated = False
             return
 
-        if self._state == GearState.TRANSITIONING_DOWN:
-            self._actuate_down(True)
-
-            elapsed_s = now - self._state_entered_at
-            if elapsed_s < 0:
-                # If time goes backwards, do not complete the transition this tick (condition for robustness)
-                return
+        self.enter_state(determined, now)
+        self._reset_validated = True
 
-            if elapsed_s >= self._deploy_time_s:
-                self.command_gear_down(False)
-            return
+    def _update_up_locked(self, now: float) -> None:
+        if self._deploy_requested:
+            self.command_gear_down(True, now)
 
-        if self._state == GearState.DOWN_LOCKED:
-            if self.up_requested():
-                if self.weight_on_wheels():  # FR002/SR003
-                    self.log("Retract inhibited: weight-on-wheels=TRUE")
-                    return
-                self._retract_requested = False
-                self.command_gear_up(True)
-            return
+    def _update_transitioning_down(self, now: float) -> None:
+        if self._deploy_actuation_stamp_armed:
+            self._stamp_deploy_actuation(now)
+        self._actuate_down(True)
 
-        if self._state == GearState.TRANSITIONING_UP:
-            self._actuate_up(True)
+        # If time goes backwards, now stays short of the deadline and the transition does not complete
+        if now >= self._state_deadline:
+            # Completion: same effect as command_gear_down(False) from this state, inlined
+            self._actuate_down(False)
+            self.enter_state(GearState.DOWN_LOCKED, now)
 
-            elapsed_s = now - self._state_entered_at
-            if elapsed_s < 0: # If time goes backwards (this condition is purely for robustness)
+    def _update_down_locked(self, now: float) -> None:
+        if self._retract_requested:
+            if self._weight_on_wheels:  # FR002/SR003
+                self.log(_RETRACT_WOW_INHIBITED_MSG, logging.WARNING)
                 return
+            self._retract_requested = False
+            self.command_gear_up(True, now)
 
-            if elapsed_s >= self._deploy_time_s:
-                self.command_gear_up(False)
-            return
+    def _update_transitioning_up(self, now: float) -> None:
+        self._actuate_up(True)
+
+        # If time goes backwards, now stays short of the deadline and the transition does not complete
+        if now >= self._state_deadline:
+            # Completion: same effect as command_gear_up(False) from this state, inlined
+            self._actuate_up(False)
+            self.enter_state(GearState.UP_LOCKED, now)
 
     # -------------------------
     # SR001 / SR002 / SR004
     # -------------------------
 
-    def _apply_sr001_auto_deploy(self) -> None:
-        # If missing required inputs, skip (mainly for initialisation)
-        if self.altitude_provider is None or self.normal_conditions_provider is None:
-            return
-
-        altitude_ft = self.altitude_provider()
-        if altitude_ft is None or not math.isfinite(float(altitude_ft)):
-            # If input is invalid, assume new event (i.e. can again decrease below altitude threshold), 
-            # so clear safety latch
-            self._auto_deploy_latched = False
-            return
-
-        normal = self.normal_conditions_provider()
-
-        if not normal:
-            # Input invalid, assume new event
-            self._auto_deploy_latched = False
-            return
-
-        if altitude_ft >= 1000.0:
+    def _apply_sr001_auto_deploy(self, altitude_ft, normal, now: float) -> None:
+        # Inputs are sampled by update(), which skips this when a provider is not wired.
+        # Only a finite altitude below 1000 ft under normal conditions keeps SR001 armed;
+        # invalid input, abnormal conditions or climbing back above 1000 ft is a new event,
+        # so the safety latch clears (and can fire again on the next descent).
+        in_envelope = (
+            normal
+            and altitude_ft is not None
+            and math.isfinite(float(altitude_ft))
+            and altitude_ft < 1000.0
+        )
+        if not in_envelope:
             self._auto_deploy_latched = False
             return
 
-        if self._state in (GearState.DOWN_LOCKED, GearState.TRANSITIONING_DOWN):
-            # If already deploying, skip (prevents continuous spamming)
+        # Rising edge only: skip if already deploying (prevents continuous spamming) or latched
+        if self._auto_deploy_latched or self._state in _DOWN_STATES:
             return
 
-        if self._auto_deploy_latched:
-            return
-
-        accepted = self.command_gear_down(True)
-        if accepted:
+        if self.command_gear_down(True, now):
             self._auto_deploy_latched = True
 
-    def _deliver_low_altitude_warning(self) -> None:
-        WARNING_TEXT = "WARNING: ALTITUDE LOW - LANDING GEAR NOT DEPLOYED"
-
-        if self.altitude_provider is None or self.normal_conditions_provider is None:
-            # Don't have required inputs so skip (initialisation)
-            return
-
-        altitude_ft = self.altitude_provider()
+    def _deliver_low_altitude_warning(self, altitude_ft, normal) -> None:
         if altitude_ft is None:
             # Reject invalid altitude
             return
 
-        normal = self.normal_conditions_provider()
-
         if (
             normal
             and altitude_ft < 2000.0
-            and self._state not in (GearState.DOWN_LOCKED, GearState.TRANSITIONING_DOWN)
+            and self._state not in _DOWN_STATES
         ):
             if not self._low_alt_warning_active:
-                self.log(WARNING_TEXT)
-                self.log("AURAL WARNING: GEAR")
+                self.log(_LOW_ALT_WARNING_MSG, logging.WARNING)
+                self.log(_AURAL_WARNING_MSG, logging.WARNING)
                 self._low_alt_warning_active = True
         else:
             self._low_alt_warning_active = False
 
-    def _apply_sr004_power_loss_default_down(self) -> None:
-        if self.primary_power_present_provider is None:
-            # Don't have inputs so skip (initialisation)
-            return
-
-        power_present = bool(self.primary_power_present_provider())
+    def _apply_sr004_power_loss_default_down(self, power_provider, now: float) -> None:
+        # Only called by update() when a power provider is wired
+        power_present = bool(power_provider())
 
         if power_present:
             # We have power! Clear latch and end function
@@ -508,32 +720,33 @@ class LandingGearController:
         self._retract_requested = False
 
         # Default to DOWN while power is not present.
-        if self._state in (GearState.DOWN_LOCKED, GearState.TRANSITIONING_DOWN):
+        if self._state in _DOWN_STATES:
             return
 
         if not self._sr004_power_loss_latched:
-            self.command_gear_down(True)
+            self.command_gear_down(True, now)
             self._sr004_power_loss_latched = True
 
     # -------------------------
     # Commands
     # -------------------------
 
-    def command_gear_down(self, enabled: bool) -> bool:
-        now = self._clock()
+    def command_gear_down(self, enabled: bool, now: float | None = None) -> bool:
+        if now is None:
+            now = self._clock()
 
         if enabled:
             # If in FAULT, ABNORMAL, RESET or NOT UP_LOCKED
-            if self._state in (GearState.FAULT, GearState.ABNORMAL):
-                self.log(f"Deploy rejected: state={self._state.name}")
+            if self._state in _INHIBIT_STATES:
+                self.log(_DEPLOY_REJECTED_MSG[self._state], logging.WARNING)
                 return False
 
-            if self._state == GearState.RESET:
-                self.log("Deploy rejected: system in RESET state")
+            if self._state is GearState.RESET:
+                self.log(_DEPLOY_IN_RESET_MSG, logging.WARNING)
                 return False
 
-            if self._state != GearState.UP_LOCKED:
-                self.log(f"Deploy rejected: state={self._state.name}")
+            if self._state is not GearState.UP_LOCKED:
+                self.log(_DEPLOY_REJECTED_MSG[self._state], logging.WARNING)
                 return False
 
             self._deploy_requested = False
@@ -552,58 +765,61 @@ class LandingGearController:
             # But stamp the actuation timestamp on the next update tick (PR001 expects scheduling delay)
             self._deploy_actuation_stamp_armed = True
 
-            self.enter_state(GearState.TRANSITIONING_DOWN)
+            self.enter_state(GearState.TRANSITIONING_DOWN, now)
             return True
 
-        if self._state == GearState.TRANSITIONING_DOWN:
+        if self._state is GearState.TRANSITIONING_DOWN:
             self._actuate_down(False)
-            self.enter_state(GearState.DOWN_LOCKED)
+            self.enter_state(GearState.DOWN_LOCKED, now)
             return True
 
         self._actuate_down(False)
         return False
 
-    def command_gear_up(self, enabled: bool) -> bool:
-        now = self._clock()
+    def command_gear_up(self, enabled: bool, now: float | None = None) -> bool:
+        if now is None:
+            now = self._clock()
 
         if enabled:
-            if self.primary_power_present_provider is not None:
-                if not bool(self.primary_power_present_provider()):  # SR004
+            power_provider = self.primary_power_present_provider
+            if power_provider is not None:
+                if not bool(power_provider()):  # SR004
                     # Actuator Physically cannot retract
-                    self.log("Retract rejected: primary control power not present")
+                    self.log(_RETRACT_NO_POWER_MSG, logging.WARNING)
                     return False
 
-            if self._state in (GearState.FAULT, GearState.ABNORMAL):
+            if self._state in _INHIBIT_STATES:
                 # System not in safe state
-                self.log(f"Retract rejected: state={self._state.name}")
+                self.log(_RETRACT_REJECTED_MSG[self._state], logging.WARNING)
                 return False
 
-            if self._state == GearState.RESET:
+            if self._state is GearState.RESET:
                 # Don't know the state of the sensor, so cannot safely issue commands
-                self.log("Retract rejected: system in RESET state")
+                self.log(_RETRACT_IN_RESET_MSG, logging.WARNING)
                 return False
 
-            if self._state != GearState.DOWN_LOCKED:
+            if self._state is not GearState.DOWN_LOCKED:
                 # Cannot start command if not at a safe starting point
-                self.log(f"Retract rejected: state={self._state.name}")
+                self.log(_RETRACT_REJECTED_MSG[self._state], logging.WARNING)
                 return False
 
-            if self.weight_on_wheels():  # FR002/SR003
-                self.log("Retract rejected: weight-on-wheels=TRUE")
+            if self._weight_on_wheels:  # FR002/SR003
+                self.log(_RETRACT_WOW_REJECTED_MSG, logging.WARNING)
                 return False
 
             self._retract_requested = False
 
             self._retract_cmd_ts = now
-            self._retract_actuation_ts = None
             self._retract_transition_ts = now
+            # Retract actuation starts with the command (no scheduling delay, unlike PR001 deploy)
+            self._retract_actuation_ts = now
             self._actuate_up(True)
-            self.enter_state(GearState.TRANSITIONING_UP)
+            self.enter_state(GearState.TRANSITIONING_UP, now)
             return True
 
-        if self._state == GearState.TRANSITIONING_UP:
+        if self._state is GearState.TRANSITIONING_UP:
             self._actuate_up(False)
-            self.enter_state(GearState.UP_LOCKED)
+            self.enter_state(GearState.UP_LOCKED, now)
             return True
 
         self._actuate_up(False)
@@ -613,70 +829,70 @@ class LandingGearController:
     # Actuation
     # -------------------------
 
-    def _actuate_down(self, enabled: bool) -> None:
-        # PR001: capture the timestamp for actuation start only on the first update tick after deploy command
-        if (
-            enabled
-            and self._deploy_cmd_ts is not None
-            and self._deploy_actuation_ts is None
-            and self._deploy_actuation_stamp_armed
-        ):
-            self._deploy_actuation_ts = self._clock()
-            self._deploy_actuation_stamp_armed = False
-        
-        # Latch PR001 latency once (do not clear on repeated deploys)
-        if (
-            self._deploy_latency_ms_latched is None
-            and self._deploy_cmd_ts is not None
-            and self._deploy_actuation_ts is not None
-        ):
-            self._deploy_latency_ms_latched = (self._deploy_actuation_ts - self._deploy_cmd_ts) * 1000.0
+    def _stamp_deploy_actuation(self, now: float) -> None:
+        # PR001: capture the timestamp for actuation start only on the first update tick after deploy command.
+        # Called by the TRANSITIONING_DOWN tick while the stamp is armed, with that tick's timestamp.
+        self._deploy_actuation_stamp_armed = False
+        if self._deploy_cmd_ts is None or self._deploy_actuation_ts is not None:
+            return
+        self._deploy_actuation_ts = now
+
+        # Latch PR001 latency once (do not clear on repeated deploys). The actuation
+        # timestamp is only ever set here, so this is the one place the latch can fill.
+        if self._deploy_latency_ms_latched is None:
+            self._deploy_latency_ms_latched = (now - self._deploy_cmd_ts) * 1000.0
 
+    # Actuator outputs only track and annunciate edges; timing stamps are taken by the
+    # command and tick paths, so a steady tick costs one comparison here. The edge
+    # messages are diagnostic chatter and are compiled out under python -O (warnings
+    # and command rejections are operator output and are always logged).
+    def _actuate_down(self, enabled: bool) -> None:
         if enabled != self._last_gear_down_cmd:
-            self.log(f"Gear down actuator command: {enabled}")
+            if __debug__:
+                self.log(_GEAR_DOWN_CMD_MSG[enabled])
             self._last_gear_down_cmd = enabled
 
 
     def _actuate_up(self, enabled: bool) -> None:
-        if enabled and self._retract_cmd_ts is not None and self._retract_actuation_ts is None:
-            # We have the required inputs, timestamp command
-            self._retract_actuation_ts = self._clock()
-
         if enabled != self._last_gear_up_cmd:
             # We have a change of actuation (either start or stop)
-            self.log(f"Gear up actuator command: {enabled}")
+            if __debug__:
+                self.log(_GEAR_UP_CMD_MSG[enabled])
             self._last_gear_up_cmd = enabled
 
     # -------------------------
     # FTHR001 / FTHR002 / FTHR003 / FTHR004
     # -------------------------
 
-    def _apply_fthr001_single_sensor_failure_handling(self) -> float | None:
-        if self.position_sensors_provider is None:
-            # Don't have the required inputs, skip (initialisation)
-            return None
-
-        readings = self.position_sensors_provider()
+    def _apply_fthr001_single_sensor_failure_handling(self, readings, summary, now: float) -> float | None:
+        # readings is this tick's sensor sample (None/empty when no provider is wired),
+        # summary its (count, sum, min, max) of valid positions
         if not readings:
-            # Reject invalid sensor readings
+            # Reject invalid sensor readings (or no inputs: initialisation)
             return None
 
-        now = self._clock()
-
-        valid = [
-            r for r in readings
-            if r.status == SensorStatus.OK and math.isfinite(float(r.position_norm))
-        ]
-        failed_count = len(readings) - len(valid)
+        n_valid, total = summary[0], summary[1]
+        failed_count = len(readings) - n_valid
 
-        # No failures: normal estimate using all readings (OK or non-finite OK still excluded above)
+        # No failures: normal estimate using all readings
         if failed_count == 0:
-            # Keep original behaviour: average all readings (including any OK-but-nonfinite would have been filtered)
-            return sum(float(r.position_norm) for r in readings) / float(len(readings))
+            return total / n_valid
 
         # One or more failures => raise maintenance fault(s)
         self._maintenance_fault_active = True
 
+        # Faults already raised and recorded on an earlier tick: nothing more to do
+        needed = _SENSOR_FAILURE_BITS if failed_count > 1 else _FTHR001_BIT
+        if (self._recorded_fault_mask & needed) != needed:
+            self._raise_sensor_failure_faults(failed_count, now)
+
+        # Estimation policy: mean of the remaining valid sensors (a single one is its own mean)
+        if n_valid:
+            return total / n_valid
+
+        return None
+
+    def _raise_sensor_failure_faults(self, failed_count: int, now: float) -> None:
         # --- FTHR001: single sensor failure fault (occurs immediately when detected) ---
         fthr001_code = "FTHR001_SINGLE_SENSOR_FAILURE"
         self._maintenance_fault_codes.add(fthr001_code)
@@ -694,14 +910,6 @@ class LandingGearController:
             self._record_fault(multi_code)
             self._pr004_classify_fault(fault_code=multi_code, occurrence_ts=now)
 
-        # Estimation policy
-        if len(valid) >= 2:
-            return sum(float(r.position_norm) for r in valid) / float(len(valid))
-        if len(valid) == 1:
-            return float(valid[0].position_norm)
-
-        return None
-
 
     def _record_fault(self, fault_code: str) -> None:
         if self._fault_recorder is None:
@@ -714,41 +922,29 @@ class LandingGearController:
 
         self._fault_recorder.record(fault_code)
         self._recorded_fault_codes.add(fault_code)
+        self._recorded_fault_mask |= _FAULT_BITS.get(fault_code, 0)
 
-    def _apply_fthr002_conflicting_position_sensors_fault(self) -> None:
+    def _apply_fthr002_conflicting_position_sensors_fault(self, readings, summary, now: float) -> None:
         # This function supports PR004 (fault classification within 400ms of fault occurrence)
         # NOTE: self._fault_classification_latency_threshold_s is used here as the FTHR002 persistence threshold.
         fault_code = "FTHR002_SENSOR_CONFLICT_PERSISTENT"
 
-        # No sensor provider => cannot evaluate
-        if self.position_sensors_provider is None:
-            # No provider, so cannot determine if sensors are connected to controller, 
-            # Hence, skip
-            self._sensor_conflict_started_at = None
-            return
-
-        readings = self.position_sensors_provider()
+        # No sensor provider (readings is None) or no readings => cannot evaluate, skip
         if not readings:
             self._sensor_conflict_started_at = None
             return
 
+        n_valid, _, lo, hi = summary
+
         # Require at least two valid OK sensors
-        valid = [
-            r for r in readings
-            if r.status == SensorStatus.OK
-            and math.isfinite(float(r.position_norm))
-        ]
-        if len(valid) < 2:
+        if n_valid < 2:
             self._sensor_conflict_started_at = None
             return
 
-        # Detect disagreement
-        positions = [float(r.position_norm) for r in valid]
-        disagreement = max(positions) - min(positions)
+        # Detect disagreement (spread of the valid positions, from the tick summary)
+        disagreement = hi - lo
         conflicting = disagreement > self._sensor_conflict_tolerance_norm # Difference between values grater than tolerance -> conflict
 
-        now = self._clock()
-
         # No conflict -> reset timer
         if not conflicting:
             self._sensor_conflict_started_at = None
@@ -783,7 +979,7 @@ class LandingGearController:
                 occurrence_ts=occurrence_ts,
             )
 
-            self.enter_state(GearState.FAULT)
+            self.enter_state(GearState.FAULT, now)
             self._record_fault(fault_code)
 
     def fault_classification_latency_ms_timeout(self, fault_code: str) -> float | None:
@@ -794,20 +990,23 @@ class LandingGearController:
         latency = (cls - occ) * 1000.0 
         return latency > self.fault_classification_latency_s_threshold
 
-    def _determine_state_from_sensors(self) -> GearState | None:
+    def _determine_state_from_sensors(self, summary=None) -> GearState | None:
         # FTHR004: Determine gear state using validated sensor inputs after reset.
-        if self.position_sensors_provider is None:
+        # summary: this tick's (count, sum, min, max) of valid positions; sampled here when not supplied.
+        if summary is None:
+            sensors_provider = self._position_sensors_provider
+            if sensors_provider is None:
+                return None
+            readings = sensors_provider()
+            if not readings:
+                return None
+            summary = _summarise_readings(readings)
+
+        n_valid, total = summary[0], summary[1]
+        if n_valid == 0:
             return None
 
-        readings = self.position_sensors_provider()
-        if not readings:
-            return None
-
-        valid = [r for r in readings if r.status == SensorStatus.OK and math.isfinite(float(r.position_norm))]
-        if len(valid) == 0:
-            return None
-
-        avg_pos = sum(r.position_norm for r in valid) / len(valid)
+        avg_pos = total / n_valid
 
         if avg_pos <= 0.1:
             return GearState.UP_LOCKED
@@ -821,20 +1020,20 @@ class LandingGearController:
     # -------------------------
 
     def _check_update_cadence(self, now: float) -> None:
-        if self._last_update_ts is None:
-            self._last_update_ts = float(now)
+        # Converted and loaded once; the previous timestamp is always stored as a float
+        now = float(now)
+        last = self._last_update_ts
+        self._last_update_ts = now
+        if last is None:
             return
 
-        dt = float(now) - float(self._last_update_ts)
-        self._last_update_ts = float(now)
+        dt = now - last
 
         # If time goes backwards, ignore this interval for cadence purposes.
         if dt < 0.0:
             return
 
-        in_transition = self._state in (GearState.TRANSITIONING_DOWN, GearState.TRANSITIONING_UP)
-
-        if in_transition:
+        if self._state in _TRANSITION_STATES:
             # PR002: require dt <= 0.1s (10Hz), boundary inclusive
             if dt > self._pr002_transition_max_dt_s:
                 self._transition_dt_violations_s.append(dt)
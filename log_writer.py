@@ -0,0 +1,134 @@
+"""
+Title: Background Log Writer
+
+Purpose:
+Moves log file I/O off the calling thread for the Landing Gear Control System
+(LGCS) recorders. Producers hand pre-formatted lines to a bounded in-memory
+queue and return immediately; a dedicated daemon thread drains the queue and
+issues one batched write per wake-up.
+
+Targeted Requirements:
+- None (supporting analysis or tooling only)
+
+Scope and Limitations:
+- One writer owns one text file handle
+- The queue is bounded; when it is full new lines are dropped and a single
+  overflow marker line reporting the drop count is written once space frees
+- Lines are only guaranteed to be in the file after flush() or close()
+- flush() waits a bounded time and returns False if the writer thread has died
+- write() after close() raises ValueError
+- Intended for simulation, testing, and academic analysis only
+
+Safety Notice:
+This software is for academic and illustrative purposes only.
+It is not flight-certified and must not be used in operational systems.
+
+Dependencies:
+- Python 3.10+
+- collections (standard library)
+- threading (standard library)
+- time (standard library)
+- typing (standard library)
+
+Related Documents:
+- LGCS Requirements Specification
+
+Safety and Certification Disclaimer:
+All artefacts in this repository are produced for academic assessment purposes only.
+They do not represent certified software and must not be used in real-world aviation
+or safety-critical systems.
+"""
+
+# log_writer.py
+
+import threading
+import time
+from collections import deque
+from typing import TextIO
+
+
+class LogWriter:
+    def __init__(self, fh: TextIO, *, max_pending: int = 4096) -> None:
+        self._fh = fh
+        self._max_pending = int(max_pending)
+
+        # deque.append/popleft are atomic under the GIL, so producers take no lock.
+        self._pending: deque = deque()
+        # Overflow count is read-and-reset by the writer thread, so it is updated under a lock
+        self._dropped_lock = threading.Lock()
+        self._dropped = 0
+        self._wake = threading.Event()
+        self._closing = False
+
+        self._thread = threading.Thread(target=self._run, name="LogWriter", daemon=True)
+        self._thread.start()
+
+    def write(self, line: str) -> None:
+        # Enqueues a complete line (including newline); never blocks on file I/O.
+        if self._closing:
+            raise ValueError("write to closed LogWriter")
+        if len(self._pending) >= self._max_pending:
+            with self._dropped_lock:
+                self._dropped += 1
+            return
+        self._pending.append(line)
+        self._wake.set()
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        # Waits until every line queued before this call has been written and flushed.
+        # Returns False if that did not happen: writer thread dead (sink I/O error, closed)
+        # or timeout expired.
+        thread = self._thread
+        if not thread.is_alive():
+            return False
+        done = threading.Event()
+        self._pending.append(done)
+        self._wake.set()
+        deadline = time.monotonic() + timeout
+        while not done.wait(0.05):
+            if not thread.is_alive() or time.monotonic() >= deadline:
+                return False
+        return True
+
+    def close(self) -> None:
+        self._closing = True
+        if self._thread.is_alive():
+            self._wake.set()
+            self._thread.join()
+        if not self._fh.closed:
+            self._fh.close()
+
+    def _run(self) -> None:
+        pending = self._pending
+        popleft = pending.popleft
+        wake = self._wake
+        fh = self._fh
+
+        while True:
+            wake.wait()
+            # Cleared before draining so a line queued mid-drain re-arms the wake-up.
+            wake.clear()
+
+            batch: list[str] = []
+            if self._dropped:
+                with self._dropped_lock:
+                    dropped, self._dropped = self._dropped, 0
+                batch.append(f"# log writer overflow: {dropped} records dropped\n")
+
+            while pending:
+                item = popleft()
+                if isinstance(item, str):
+                    batch.append(item)
+                    continue
+                # flush() marker: everything ahead of it is now in the batch.
+                fh.writelines(batch)
+                batch.clear()
+                fh.flush()
+                item.set()
+
+            if batch:
+                fh.writelines(batch)
+                fh.flush()
+
+            if self._closing and not pending:
+                return
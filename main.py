@@ -20,6 +20,8 @@ Scope and Limitations:
 - Performs startup-time configuration validation but not runtime certification
 - Assumes a POSIX-compatible environment for signal handling
 - Relies on injected simulation components rather than real hardware interfaces
+- LGCS_LOCK_MEMORY=1 locks process memory while the control loop runs (Linux only;
+  requires CAP_IPC_LOCK or a sufficient RLIMIT_MEMLOCK)
 
 Safety Notice:
 This software is for academic and illustrative purposes only.
@@ -28,7 +30,9 @@ It is not flight-certified and must not be used in operational systems.
 Dependencies:
 - Python 3.10+
 - logging (standard library)
+- os (standard library)
 - signal (standard library)
+- sys (standard library)
 - threading (standard library)
 - pathlib (standard library)
 
@@ -44,7 +48,9 @@ or safety-critical systems.
 """
 
 import logging
+import os
 import signal
+import sys
 import time
 from threading import Event
 from pathlib import Path
@@ -53,7 +59,7 @@ from gear_configuration import GearConfiguration
 from landing_gear_controller import LandingGearController
 from app_context import AppContext
 from cli import run_rich_cli
-from cli_support import MutableBool, MutableFloat, PositionSensorBank, ControlLoop
+from cli_support import Environment, PositionSensorBank, ControlLoop
 from command_recorder import CommandRecorder
 
 try:
@@ -62,12 +68,33 @@ except Exception:
     FaultRecorder = None
 
 
+# Set once the controller console handler is installed, so repeat calls add nothing.
+_logging_configured = False
+
+
 def setup_logging():
+    # Idempotent: called by initialize(), so every entry point (main.py, cli.py) gets it.
+    global _logging_configured
+    if _logging_configured:
+        return
+    _logging_configured = True
+
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s [%(levelname)s] %(message)s",
     )
 
+    # Controller messages are operator output: plain text on stdout, written on the
+    # calling thread so they stay in order with the CLI's own prints (messages are
+    # edge-triggered, so this is not a per-tick write).
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(logging.Formatter("%(message)s"))
+
+    controller_logger = logging.getLogger(LandingGearController.__module__)
+    controller_logger.setLevel(logging.INFO)
+    controller_logger.addHandler(console)
+    controller_logger.propagate = False
+
 
 def setup_signal_handlers(ctx: AppContext):
     def _handle_shutdown(signum, frame):
@@ -78,6 +105,7 @@ def setup_signal_handlers(ctx: AppContext):
 
 
 def initialize() -> AppContext:
+    setup_logging()
     logging.info("Initializing application")
 
     # Anchor paths and create output directories
@@ -105,20 +133,17 @@ def initialize() -> AppContext:
     clock = time.monotonic
 
     # Rich CLI mutable environment inputs
-    altitude = MutableFloat(5000.0)
-    normal = MutableBool(True)
-    power = MutableBool(True)
-    wow = MutableBool(True)
+    env = Environment(altitude=5000.0, normal=True, power=True, wow=True)
     sensors = PositionSensorBank()
 
     def altitude_provider() -> float:
-        return float(altitude.value)
+        return float(env.altitude)
 
     def normal_provider() -> bool:
-        return bool(normal.value)
+        return bool(env.normal)
 
     def power_provider() -> bool:
-        return bool(power.value)
+        return bool(env.power)
 
     def sensors_provider():
         return sensors.get_readings()
@@ -139,19 +164,21 @@ def initialize() -> AppContext:
         fault_recorder=fault_recorder,
     )
 
-    controller.set_weight_on_wheels(wow.value)
+    controller.set_weight_on_wheels(env.wow)
 
-    loop = ControlLoop(controller, period_s=0.1)
+    # Memory locking (mlockall) is opt-in: LGCS_LOCK_MEMORY=1
+    loop = ControlLoop(
+        controller,
+        period_s=0.1,
+        lock_memory=os.environ.get("LGCS_LOCK_MEMORY") == "1",
+    )
 
     return AppContext(
         controller=controller,
         config=config,
         clock=clock,
         shutdown_event=Event(),
-        altitude=altitude,
-        normal=normal,
-        power=power,
-        wow=wow,
+        env=env,
         sensors=sensors,
         loop=loop,
         command_recorder=command_recorder, 
@@ -160,7 +187,6 @@ def initialize() -> AppContext:
 
 
 def main():
-    setup_logging()
     ctx = initialize()
     setup_signal_handlers(ctx)
 
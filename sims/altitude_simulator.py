@@ -27,6 +27,7 @@ It is not flight-certified and must not be used in operational systems.
 Dependencies:
 - Python 3.10+
 - random (standard library)
+- Optional: numba (JIT-compiles the step kernel when installed)
 
 Related Documents:
 - LGCS Requirements Specification
@@ -39,6 +40,44 @@ or safety-critical systems.
 """
 
 import random
+from typing import Sequence
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _step_kernel(altitude, vert_speed, dt, max_speed, min_alt, max_alt, accel):
+    # Pure scalar integration step for one pre-drawn acceleration sample.
+    # Limits are passed per call rather than baked in, since they are public,
+    # mutable simulator attributes.
+    vert_speed += accel * dt
+
+    if vert_speed < -max_speed:
+        vert_speed = -max_speed
+    elif vert_speed > max_speed:
+        vert_speed = max_speed
+
+    altitude += vert_speed * dt
+
+    # Bounce off the floor/ceiling by forcing the vertical speed away from the bound.
+    if altitude <= min_alt:
+        altitude = min_alt
+        if vert_speed < 0.0:
+            vert_speed = -vert_speed
+    elif altitude >= max_alt:
+        altitude = max_alt
+        if vert_speed > 0.0:
+            vert_speed = -vert_speed
+
+    return altitude, vert_speed
+
+
+if njit is not None:
+    # Strict IEEE semantics (no fastmath) so both paths produce the same trajectory.
+    # Compiled lazily on the first step; cache=True keeps that a one-off per install.
+    _step_kernel = njit(cache=True)(_step_kernel)
 
 
 class AltitudeSimulator:
@@ -69,32 +108,66 @@ class AltitudeSimulator:
         if dt <= 0.0:
             return self.altitude
 
-        accel = self.rng.uniform(-self.max_accel, self.max_accel)
-        self.vert_speed += accel * dt
-
-        self.vert_speed = max(-self.max_speed, min(self.vert_speed, self.max_speed))
-        self.altitude += self.vert_speed * dt
-
-        if self.altitude <= self.min_alt:
-            self.altitude = self.min_alt
-            self.vert_speed = abs(self.vert_speed)
-        elif self.altitude >= self.max_alt:
-            self.altitude = self.max_alt
-            self.vert_speed = -abs(self.vert_speed)
-
+        # accel = U[0, 1) * span - max_accel; read per call since rng/max_accel are public
+        max_accel = self.max_accel
+        accel = self.rng.random() * (2.0 * max_accel) - max_accel
+        self.altitude, self.vert_speed = _step_kernel(
+            self.altitude,
+            self.vert_speed,
+            float(dt),
+            self.max_speed,
+            self.min_alt,
+            self.max_alt,
+            accel,
+        )
         return self.altitude
 
+    def step_many(self, dts: Sequence[float]) -> list[float]:
+        # Advance simulation over a sequence of dt values and return the altitude trajectory.
+        # Equivalent to calling step(dt) for each entry, with attribute lookups hoisted out of the loop.
+        rand = self.rng.random
+        altitude = self.altitude
+        vert_speed = self.vert_speed
+        max_speed = self.max_speed
+        max_accel = self.max_accel
+        accel_span = 2.0 * max_accel
+        min_alt = self.min_alt
+        max_alt = self.max_alt
+
+        trajectory: list[float] = []
+        append = trajectory.append
+        for dt in dts:
+            if dt > 0.0:
+                altitude, vert_speed = _step_kernel(
+                    altitude,
+                    vert_speed,
+                    float(dt),
+                    max_speed,
+                    min_alt,
+                    max_alt,
+                    rand() * accel_span - max_accel,
+                )
+            append(altitude)
+
+        self.altitude = altitude
+        self.vert_speed = vert_speed
+        return trajectory
+
     def update(self) -> float:
         # Advance simulation using the injected clock.
-        if not self.clock:
+        clock = self.clock
+        if not clock:
             raise RuntimeError(
                 "AltitudeSimulator.update() requires a clock; use step(dt) instead."
             )
 
-        now = self.clock()
-        dt = now - (self._last_time if self._last_time is not None else now)
+        now = clock()
+        last = self._last_time
         self._last_time = now
-        return self.step(dt)
+        if last is None:
+            # First sample after a clock is attached; nothing to integrate yet.
+            return self.altitude
+        return self.step(now - last)
 
     def read_altitude_ft(self) -> float:
         # Return altitude without advancing the simulation.
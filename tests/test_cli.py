@@ -46,9 +46,16 @@ They do not represent certified software and must not be used in real-world avia
 or safety-critical systems.
 """
 
+import logging
+import threading
+
 import pytest
 
-from cli import StateAnnunciator
+import main
+from app_context import AppContext
+from cli import StateAnnunciator, _HANDLERS, _dispatch
+from cli_support import ControlLoop, Environment, PositionSensorBank
+from command_recorder import CommandRecorder
 from gear_configuration import GearConfiguration
 from gear_states import GearState
 from landing_gear_controller import LandingGearController
@@ -131,6 +138,14 @@ def test_fr003_state_annunciator_prints_again_when_state_changes(controller, cap
     ]
 
 
+def test_gear_state_formats_as_its_name():
+    state = GearState.TRANSITIONING_DOWN
+
+    assert str(state) == "TRANSITIONING_DOWN"
+    assert f"{state}" == "TRANSITIONING_DOWN"
+    assert f"[{state:<20}]" == "[TRANSITIONING_DOWN  ]"
+
+
 @pytest.mark.parametrize("abnormal_state", [GearState.FAULT, GearState.RESET])
 def test_fr004_retract_ignored_in_fault_or_abnormal_states(controller, abnormal_state):
     controller.enter_state(abnormal_state)
@@ -138,3 +153,74 @@ def test_fr004_retract_ignored_in_fault_or_abnormal_states(controller, abnormal_
     accepted = controller.command_gear_up(True)
     assert accepted is False
     assert controller.state == abnormal_state
+
+
+@pytest.mark.parametrize(
+    "op",
+    ["help", "q", "run", "stop", "step", "period", "d", "u", "wow", "alt", "normal",
+     "power", "sens", "state", "status", "lat", "faults", "reset"],
+)
+def test_cli_dispatch_table_covers_documented_commands(op):
+    assert op in _HANDLERS
+
+
+def test_cli_dispatch_table_aliases_share_handlers():
+    assert _HANDLERS["quit"] is _HANDLERS["q"]
+    assert _HANDLERS["exit"] is _HANDLERS["q"]
+    assert _HANDLERS["?"] is _HANDLERS["help"]
+
+
+@pytest.fixture
+def cli_ctx(tmp_path, controller):
+    clock = FakeClock()
+    return AppContext(
+        controller=controller,
+        config=controller._config,
+        clock=clock,
+        shutdown_event=threading.Event(),
+        env=Environment(),
+        sensors=PositionSensorBank(),
+        loop=ControlLoop(controller),
+        command_recorder=CommandRecorder(filepath=tmp_path / "cmds.csv", clock=clock),
+    )
+
+
+def test_cli_dispatch_runs_handler_and_records_command(cli_ctx, capsys):
+    assert _dispatch(cli_ctx, "  WOW 0 ") is True
+
+    assert cli_ctx.env.wow is False
+    assert "WOW set to False" in capsys.readouterr().out
+    cli_ctx.command_recorder.sync()
+    lines = (cli_ctx.command_recorder.filepath).read_text().splitlines()
+    assert lines[-1].endswith(",WOW 0,set_wow,True")
+
+
+def test_cli_dispatch_records_embedded_line_breaks_escaped(cli_ctx):
+    assert _dispatch(cli_ctx, "wow\r0") is True
+
+    assert cli_ctx.env.wow is False
+    cli_ctx.command_recorder.sync()
+    lines = (cli_ctx.command_recorder.filepath).read_text().splitlines()
+    assert lines[-1].endswith(",wow\\r0,set_wow,True")
+
+
+def test_cli_dispatch_unknown_and_quit(cli_ctx, capsys):
+    assert _dispatch(cli_ctx, "") is True
+    assert _dispatch(cli_ctx, "bogus") is True
+    assert "Unknown command" in capsys.readouterr().out
+
+    assert _dispatch(cli_ctx, "quit") is False
+    assert cli_ctx.shutdown_event.is_set()
+
+
+def test_setup_logging_installs_controller_console_once(monkeypatch):
+    logger = logging.getLogger(LandingGearController.__module__)
+    monkeypatch.setattr(main, "_logging_configured", False)
+    monkeypatch.setattr(logger, "handlers", [])
+    monkeypatch.setattr(logger, "propagate", True)
+    monkeypatch.setattr(logger, "level", logger.level)
+
+    main.setup_logging()
+    main.setup_logging()
+
+    assert len(logger.handlers) == 1
@@ -0,0 +1,282 @@
+"""
+Title: CLI Support Utilities Unit Tests
+
+Purpose:
+Provides unit-level verification of the CLI support utilities: the position
+sensor bank's formatted readings, the shutdown-aware stdin line reader (selector
+and reader-thread paths), and the ControlLoop's stepping, prompt stop and
+optional memory locking.
+
+Targeted Requirements (Verification Only):
+- None (supporting simulation and tooling only)
+
+Scope and Limitations:
+- Stdin is simulated with pipes, temporary files and in-memory streams.
+- Memory locking is verified against a fake C library; no pages are locked.
+- Does not verify loop timing accuracy or real-time behaviour.
+
+Safety Notice:
+This file is a test artefact intended solely for verification and assessment.
+It must not be used in operational or flight-certified systems.
+
+Dependencies:
+- Python 3.10+
+- pytest
+- cli_support.py
+- sims/position_simulator.py
+
+Related Documents:
+- LGCS Unit Test Plan
+
+Safety and Certification Disclaimer:
+All artefacts in this repository are produced for academic assessment purposes only.
+They do not represent certified software and must not be used in real-world aviation
+or safety-critical systems.
+"""
+
+import io
+import os
+import threading
+import time
+
+import pytest
+
+import cli_support
+from cli_support import ControlLoop, PositionSensorBank, StdinReader
+from sims.position_simulator import PositionSensorReading, SensorStatus
+
+
+def test_sensor_bank_formatted_readings_refresh_after_set():
+    bank = PositionSensorBank()
+    assert bank.get_formatted() == "OK:0.000, OK:0.000"
+
+    bank.set_readings([
+        PositionSensorReading(SensorStatus.OK, 0.25),
+        PositionSensorReading(SensorStatus.FAILED, 1.0),
+    ])
+    assert bank.get_formatted() == "OK:0.250, FAILED:1.000"
+
+
+@pytest.mark.skipif(os.name != "posix", reason="selector-based stdin polling is POSIX only")
+def test_stdin_reader_returns_lines_then_raises_eof():
+    r_fd, w_fd = os.pipe()
+    os.write(w_fd, b"status\nstep 2\nq")
+    os.close(w_fd)
+
+    with os.fdopen(r_fd, "r") as stream:
+        reader = StdinReader(threading.Event(), stream=stream, poll_s=0.01)
+
+        assert reader.readline() == "status"
+        assert reader.readline() == "step 2"
+        assert reader.readline() == "q"
+        with pytest.raises(EOFError):
+            reader.readline()
+
+
+@pytest.mark.skipif(os.name != "posix", reason="selector-based stdin polling is POSIX only")
+def test_stdin_reader_returns_none_once_shutdown_requested():
+    r_fd, w_fd = os.pipe()
+    shutdown = threading.Event()
+
+    with os.fdopen(r_fd, "r") as stream:
+        reader = StdinReader(shutdown, stream=stream, poll_s=0.01)
+        threading.Timer(0.05, shutdown.set).start()
+
+        assert reader.readline() is None
+
+    os.close(w_fd)
+
+
+def test_stdin_reader_reads_redirected_regular_file(tmp_path):
+    path = tmp_path / "cmds.txt"
+    path.write_text("status\nq\n", encoding="utf-8")
+
+    with path.open("r", encoding="utf-8") as stream:
+        reader = StdinReader(threading.Event(), stream=stream, poll_s=0.01)
+
+        assert reader.readline() == "status"
+        assert reader.readline() == "q"
+        with pytest.raises(EOFError):
+            reader.readline()
+
+
+def test_stdin_reader_falls_back_to_reader_thread_without_fileno():
+    reader = StdinReader(threading.Event(), stream=io.StringIO("d\n"), poll_s=0.01)
+
+    assert reader.readline() == "d"
+    with pytest.raises(EOFError):
+        reader.readline()
+
+
+class CountingController:
+    def __init__(self):
+        self.updates = 0
+
+    def update(self) -> None:
+        self.updates += 1
+
+
+def test_control_loop_step_runs_n_updates_and_ticks():
+    ctrl = CountingController()
+    ticks: list[object] = []
+    loop = ControlLoop(ctrl, on_tick=ticks.append)
+
+    loop.step(5)
+
+    assert ctrl.updates == 5
+    assert ticks == [ctrl] * 5
+
+
+def test_control_loop_stop_does_not_wait_out_the_period():
+    ctrl = CountingController()
+    loop = ControlLoop(ctrl, period_s=5.0)
+
+    loop.start()
+    time.sleep(0.05)
+    t0 = time.monotonic()
+    loop.stop()
+
+    assert time.monotonic() - t0 < 1.0
+    assert ctrl.updates == 1
+
+
+class FakeLibc:
+    def __init__(self, mlockall_rc: int = 0):
+        self.calls: list[str] = []
+        self._rc = mlockall_rc
+
+    def mlockall(self, flags: int) -> int:
+        self.calls.append(f"mlockall({flags})")
+        return self._rc
+
+    def munlockall(self) -> int:
+        self.calls.append("munlockall")
+        return 0
+
+
+def test_control_loop_locks_memory_while_running_and_unlocks_on_stop(monkeypatch):
+    libc = FakeLibc()
+    monkeypatch.setattr(cli_support, "_load_libc", lambda: libc)
+    loop = ControlLoop(CountingController(), period_s=0.01, lock_memory=True)
+
+    loop.start()
+    time.sleep(0.05)
+    assert loop.memory_locked is True
+    loop.stop()
+
+    assert loop.memory_locked is False
+    assert libc.calls == ["mlockall(1)", "munlockall"]
+
+
+def test_control_loop_reports_memory_lock_failure(monkeypatch, caplog):
+    libc = FakeLibc(mlockall_rc=-1)
+    monkeypatch.setattr(cli_support, "_load_libc", lambda: libc)
+    loop = ControlLoop(CountingController(), period_s=0.01, lock_memory=True)
+
+    loop.start()
+    time.sleep(0.05)
+    loop.stop()
+
+    assert loop.memory_locked is False
+    assert libc.calls == ["mlockall(1)"]
+    assert "mlockall failed" in caplog.text
+
+
+def test_control_loop_does_not_lock_memory_by_default(monkeypatch):
+    libc = FakeLibc()
+    monkeypatch.setattr(cli_support, "_load_libc", lambda: libc)
+    loop = ControlLoop(CountingController(), period_s=0.01)
+
+    loop.start()
+    time.sleep(0.05)
+    loop.stop()
+
+    assert libc.calls == []
+
+
+class FakeSched:
+    # Stands in for the os scheduling calls; fail=True makes each one raise like an EPERM
+    def __init__(self, monkeypatch, fail: bool = False):
+        self.calls: list[tuple] = []
+        self._fail = fail
+        monkeypatch.setattr(cli_support.sys, "platform", "linux")
+        monkeypatch.setattr(cli_support.os, "SCHED_FIFO", 1, raising=False)
+        monkeypatch.setattr(cli_support.os, "sched_param", lambda priority: priority, raising=False)
+        monkeypatch.setattr(cli_support.os, "sched_get_priority_min", lambda policy: 1, raising=False)
+        monkeypatch.setattr(cli_support.os, "sched_setaffinity", self.setaffinity, raising=False)
+        monkeypatch.setattr(cli_support.os, "sched_setscheduler", self.setscheduler, raising=False)
+
+    def setaffinity(self, pid, cpus):
+        self.calls.append(("sched_setaffinity", pid, set(cpus)))
+        if self._fail:
+            raise OSError("not permitted")
+
+    def setscheduler(self, pid, policy, param):
+        self.calls.append(("sched_setscheduler", pid, policy, param))
+        if self._fail:
+            raise OSError("not permitted")
+
+
+def run_briefly(loop: ControlLoop) -> None:
+    loop.start()
+    time.sleep(0.05)
+    loop.stop()
+
+
+def test_control_loop_pin_cpu_sets_affinity_only(monkeypatch):
+    sched = FakeSched(monkeypatch)
+
+    run_briefly(ControlLoop(CountingController(), period_s=0.01, pin_cpu=2))
+
+    assert sched.calls == [("sched_setaffinity", 0, {2})]
+
+
+def test_control_loop_realtime_requests_fifo_scheduling(monkeypatch):
+    sched = FakeSched(monkeypatch)
+
+    run_briefly(ControlLoop(CountingController(), period_s=0.01, pin_cpu=0, realtime=True))
+
+    assert sched.calls == [("sched_setaffinity", 0, {0}), ("sched_setscheduler", 0, 1, 1)]
+
+
+def test_control_loop_swallows_scheduling_failures(monkeypatch):
+    sched = FakeSched(monkeypatch, fail=True)
+    ctrl = CountingController()
+
+    run_briefly(ControlLoop(ctrl, period_s=0.01, pin_cpu=0, realtime=True))
+
+    assert len(sched.calls) == 2
+    assert ctrl.updates > 1
+
+
+class RecordingEvent:
+    def __init__(self):
+        self.timeouts: list[float] = []
+
+    def wait(self, timeout: float) -> bool:
+        self.timeouts.append(timeout)
+        return False
+
+
+def test_control_loop_spins_to_the_deadline_by_default():
+    loop = ControlLoop(CountingController())
+    loop._stop_evt = RecordingEvent()
+
+    deadline = time.monotonic() + 0.05
+    assert loop._wait_until(deadline) is False
+
+    # The fake event returns at once, so only the spin phase can have reached the deadline
+    assert loop._stop_evt.timeouts[0] <= 0.05 - cli_support._INITIAL_SLEEP_OVERSHOOT_S
+    assert time.monotonic() >= deadline
+
+
+def test_control_loop_realtime_does_not_spin():
+    loop = ControlLoop(CountingController(), realtime=True)
+    loop._stop_evt = RecordingEvent()
+
+    deadline = time.monotonic() + 0.5
+    assert loop._wait_until(deadline) is False
+
+    # Whole delay handed to the blocking wait, nothing burnt on the clock afterwards
+    assert len(loop._stop_evt.timeouts) == 1
+    assert time.monotonic() < deadline
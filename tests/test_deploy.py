@@ -39,6 +39,10 @@ They do not represent certified software and must not be used in real-world avia
 or safety-critical systems.
 """
 
+import copy
+import logging
+import dataclasses
+
 import pytest
 
 from gear_configuration import GearConfiguration
@@ -74,7 +78,7 @@ class SpyLandingGearController(LandingGearController):
         
         self.update()
 
-    def log(self, msg: str) -> None:
+    def log(self, msg: str, level: int = logging.INFO) -> None:
         self.logs.append(msg)
 
     def _actuate_down(self, enabled: bool) -> None:
@@ -215,3 +219,20 @@ def test_fr004_deploy_rejected_in_fault_or_abnormal_states(abnormal_state, confi
     assert ok is False
     assert c._state == abnormal_state
     assert c.down_cmds == []
+
+
+def test_config_derived_deploy_time_is_not_a_dataclass_field(config):
+    assert "_deploy_time_ms" not in dataclasses.asdict(config)
+    assert [f.name for f in dataclasses.fields(config)] == [
+        "name",
+        "pump_latency_ms",
+        "actuator_speed_mm_per_100ms",
+        "extension_distance_mm",
+        "lock_time_ms",
+        "requirement_time_ms",
+    ]
+
+    copied = copy.deepcopy(config)
+    assert copied == config
+    assert copied.deploy_time_s == config.deploy_time_s
+    assert copied.compute_deploy_time_ms() == config.compute_deploy_time_ms()
@@ -122,6 +122,28 @@ class TestFaultTolerance:
 
         assert controller.position_estimate_norm in (None, 0.7)
 
+    def test_snapshot_reports_maintenance_fault_codes_sorted(self):
+        controller, clock = make_controller_with_fake_clock()
+
+        readings = [
+            PositionSensorReading(SensorStatus.OK, 0.7),
+            PositionSensorReading(SensorStatus.FAILED, 0.0),
+            PositionSensorReading(SensorStatus.FAILED, 1.0),
+        ]
+        controller.position_sensors_provider = lambda: readings
+
+        controller.update()
+        snap = controller.snapshot()
+
+        assert snap.state == controller.state
+        assert snap.maintenance_fault_active is True
+        assert snap.maintenance_fault_codes == [
+            "FTHR001_SINGLE_SENSOR_FAILURE",
+            "MULTIPLE_SENSOR_FAILURE",
+        ]
+        assert snap.fault_classified_codes == snap.maintenance_fault_codes
+        assert snap.sensor_conflict_fault_latched is False
+
     def test_fthr001_no_maintenance_fault_when_all_sensors_ok(self):
         controller, clock = make_controller_with_fake_clock()
 
@@ -177,6 +199,27 @@ class TestFaultTolerance:
         assert controller.command_gear_down(True) is False
         assert controller.command_gear_up(True) is False
 
+    def test_fthr002_reset_latches_clears_conflict_tracking(self):
+        controller, clock = make_controller_with_fake_clock()
+
+        readings = [
+            PositionSensorReading(SensorStatus.OK, 0.0),
+            PositionSensorReading(SensorStatus.OK, 1.0),
+        ]
+        controller.position_sensors_provider = lambda: readings
+
+        controller.update()
+        clock.advance(0.51)
+        controller.update()
+        assert controller.state == GearState.FAULT
+
+        controller.enter_state(GearState.RESET)
+        controller.reset_latches()
+
+        snap = controller.snapshot()
+        assert snap.sensor_conflict_started_at is None
+        assert snap.sensor_conflict_fault_latched is False
+
     def test_fthr002_edge_at_exactly_500ms_not_in_fault(self):
         controller, clock = make_controller_with_fake_clock()
 
@@ -358,3 +401,98 @@ class TestFaultTolerance:
         controller.update()
 
         assert controller.state == GearState.UP_LOCKED
+
+    def test_position_sensors_sampled_once_per_update(self):
+        controller, clock = make_controller_with_fake_clock()
+
+        calls = []
+        readings = [
+            PositionSensorReading(SensorStatus.OK, 0.0),
+            PositionSensorReading(SensorStatus.OK, 0.05),
+        ]
+
+        def provider():
+            calls.append(clock())
+            return readings
+
+        controller.position_sensors_provider = provider
+
+        controller.update()
+        clock.advance(0.1)
+        controller.update()
+
+        assert calls == [0.0, 0.1]
+        assert controller.state == GearState.UP_LOCKED
+
+    def test_fthr001_faults_recorded_once_and_escalate_to_multiple_failure(self, tmp_path: Path):
+        controller, clock = make_controller_with_fake_clock()
+
+        readings = [
+            PositionSensorReading(SensorStatus.OK, 0.8),
+            PositionSensorReading(SensorStatus.OK, 0.9),
+            PositionSensorReading(SensorStatus.FAILED, 0.0),
+        ]
+        controller.position_sensors_provider = lambda: readings
+
+        # Raised before a recorder is attached; recorded once one is
+        controller.update()
+        log_path = tmp_path / "fault_log.txt"
+        controller.fault_recorder = FaultRecorder(filepath=log_path, clock=clock)
+        for _ in range(3):
+            clock.advance(0.01)
+            controller.update()
+
+        readings[1] = PositionSensorReading(SensorStatus.FAILED, 0.0)
+        for _ in range(3):
+            clock.advance(0.01)
+            controller.update()
+
+        codes = [line.split(",", 1)[1] for line in log_path.read_text(encoding="utf-8").splitlines()]
+        assert codes == ["FTHR001_SINGLE_SENSOR_FAILURE", "MULTIPLE_SENSOR_FAILURE"]
+
+    def test_sensors_not_sampled_while_fault_latched(self):
+        controller, clock = make_controller_with_fake_clock()
+
+        calls = []
+        readings = [
+            PositionSensorReading(SensorStatus.OK, 0.0),
+            PositionSensorReading(SensorStatus.OK, 1.0),
+        ]
+
+        def provider():
+            calls.append(clock())
+            return readings
+
+        controller.position_sensors_provider = provider
+
+        controller.update()
+        clock.advance(0.6)
+        controller.update()
+        assert controller.state == GearState.FAULT
+
+        n_calls = len(calls)
+        clock.advance(0.1)
+        controller.update()
+
+        assert len(calls) == n_calls
+        assert controller.state == GearState.FAULT
+
+    def test_fthr002_persistent_conflict_escalates_abnormal_to_fault(self, tmp_path: Path):
+        controller, clock = make_controller_with_fake_clock()
+
+        log_path = tmp_path / "fault_log.txt"
+        controller.fault_recorder = FaultRecorder(filepath=log_path, clock=clock)
+        readings = [
+            PositionSensorReading(SensorStatus.OK, 0.0),
+            PositionSensorReading(SensorStatus.OK, 1.0),
+        ]
+        controller.position_sensors_provider = lambda: readings
+        controller.enter_state(GearState.ABNORMAL)
+
+        controller.update()
+        clock.advance(0.6)
+        controller.update()
+
+        assert controller.state == GearState.FAULT
+        assert "FTHR002_SENSOR_CONFLICT_PERSISTENT" in log_path.read_text(encoding="utf-8")
+        assert controller.snapshot().sensor_conflict_started_at is None
@@ -42,6 +42,9 @@ They do not represent certified software and must not be used in real-world avia
 or safety-critical systems.
 """
 
+import logging
+import weakref
+
 import pytest
 
 from gear_configuration import GearConfiguration
@@ -64,7 +67,7 @@ class SpyLandingGearController(LandingGearController):
         self.down_cmds: list[bool] = []
         self.logs: list[str] = []
 
-    def log(self, msg: str) -> None:
+    def log(self, msg: str, level: int = logging.INFO) -> None:
         self.logs.append(msg)
 
     def _actuate_up(self, enabled: bool) -> None:
@@ -76,10 +79,8 @@ class SpyLandingGearController(LandingGearController):
         super()._actuate_down(enabled)
 
 
-@pytest.fixture
-def controller():
-    clock = FakeClock()
-    cfg = GearConfiguration(
+def make_config() -> GearConfiguration:
+    return GearConfiguration(
         name="TEST",
         pump_latency_ms=0,
         actuator_speed_mm_per_100ms=100.0,
@@ -87,7 +88,11 @@ def controller():
         lock_time_ms=0,
         requirement_time_ms=8000,
     )
-    return SpyLandingGearController(config=cfg, clock=clock)
+
+
+@pytest.fixture
+def controller():
+    return SpyLandingGearController(config=make_config(), clock=FakeClock())
 
 
 ABNORMAL_STATES = [GearState.FAULT, GearState.ABNORMAL]
@@ -136,3 +141,28 @@ def test_reset_rejects_retract_command(controller):
     accepted = controller.command_gear_up(True)
     assert accepted is False
     assert controller.state == GearState.RESET
+
+
+def test_controller_supports_weak_references(controller):
+    ref = weakref.ref(controller)
+
+    assert ref() is controller
+
+
+def test_controller_instances_have_no_attribute_dict():
+    plain = LandingGearController(config=make_config(), clock=FakeClock())
+
+    assert not hasattr(plain, "__dict__")
+    with pytest.raises(AttributeError):
+        plain.undeclared_attribute = True
+
+
+def test_controller_log_can_be_overridden_per_instance():
+    plain = LandingGearController(config=make_config(), clock=FakeClock())
+    messages: list[tuple[str, int]] = []
+
+    plain.log = lambda msg, level=logging.INFO: messages.append((msg, level))
+    plain.enter_state(GearState.FAULT)
+    plain.command_gear_down(True)
+
+    assert ("Deploy rejected: state=FAULT", logging.WARNING) in messages
@@ -0,0 +1,96 @@
+"""
+Title: Background Log Writer Unit Tests
+
+Purpose:
+Provides unit-level verification of the LogWriter used by the LGCS recorders:
+queued lines reach the file in order once flushed, and lines dropped while the
+bounded queue is full are reported by a single overflow marker.
+
+Targeted Requirements (Verification Only):
+- None (supporting tooling only)
+
+Scope and Limitations:
+- Tests the writer against temporary files only.
+- Does not verify durability (fsync) or throughput.
+
+Safety Notice:
+This file is a test artefact intended solely for verification and assessment.
+It must not be used in operational or flight-certified systems.
+
+Dependencies:
+- Python 3.10+
+- pytest
+- log_writer.py
+
+Related Documents:
+- LGCS Unit Test Plan
+
+Safety and Certification Disclaimer:
+All artefacts in this repository are produced for academic assessment purposes only.
+They do not represent certified software and must not be used in real-world aviation
+or safety-critical systems.
+"""
+
+import time
+
+import pytest
+
+from log_writer import LogWriter
+
+
+def test_log_writer_flush_writes_queued_lines_in_order(tmp_path):
+    path = tmp_path / "out.log"
+    writer = LogWriter(path.open("a", encoding="utf-8"))
+
+    for i in range(100):
+        writer.write(f"{i}\n")
+    writer.flush()
+
+    assert path.read_text().splitlines() == [str(i) for i in range(100)]
+    writer.close()
+
+
+def test_log_writer_reports_dropped_lines_when_queue_is_full(tmp_path):
+    path = tmp_path / "out.log"
+    writer = LogWriter(path.open("a", encoding="utf-8"), max_pending=0)
+
+    writer.write("a\n")
+    writer.write("b\n")
+    writer.close()
+
+    assert path.read_text() == "# log writer overflow: 2 records dropped\n"
+
+
+def test_log_writer_write_after_close_raises(tmp_path):
+    writer = LogWriter((tmp_path / "out.log").open("a", encoding="utf-8"))
+    writer.close()
+
+    with pytest.raises(ValueError):
+        writer.write("late\n")
+
+
+class FailingSink:
+    closed = False
+
+    def writelines(self, lines) -> None:
+        raise OSError("disk gone")
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_log_writer_flush_returns_false_once_writer_thread_died():
+    writer = LogWriter(FailingSink())
+
+    writer.write("a\n")
+    t0 = time.monotonic()
+
+    assert writer.flush(timeout=2.0) is False
+    assert time.monotonic() - t0 < 1.0
+    writer.close()
+    with pytest.raises(ValueError):
+        writer.write("b\n")
@@ -39,6 +39,8 @@ They do not represent certified software and must not be used in real-world avia
 or safety-critical systems.
 """
 
+import logging
+
 import pytest
 
 from gear_configuration import GearConfiguration
@@ -64,7 +66,7 @@ class SpyLandingGearController(LandingGearController):
         self.up_cmds: list[bool] = []
         self.logs: list[str] = []
 
-    def log(self, msg: str) -> None:
+    def log(self, msg: str, level: int = logging.INFO) -> None:
         self.logs.append(msg)
 
     def _actuate_down(self, enabled: bool) -> None:
@@ -50,6 +50,7 @@ They do not represent certified software and must not be used in real-world avia
 or safety-critical systems.
 """
 
+import logging
 import random
 import pytest
 
@@ -142,6 +143,20 @@ class TestSafety:
 
         assert controller.state in (GearState.TRANSITIONING_DOWN, GearState.DOWN_LOCKED)
 
+    def test_sr001_auto_deploy_with_providers_wired_after_construction(self):
+        controller, sim, clock = make_controller_with_fake_clock(normal_conditions=True)
+        altitude_provider = controller.altitude_provider
+
+        controller.altitude_provider = None
+        controller.enter_state(GearState.UP_LOCKED)
+        sim.set_altitude_ft(999.0)
+        controller.update()
+        assert controller.state == GearState.UP_LOCKED
+
+        controller.altitude_provider = altitude_provider
+        controller.update()
+        assert controller.state in (GearState.TRANSITIONING_DOWN, GearState.DOWN_LOCKED)
+
     def test_sr001_no_auto_deploy_when_not_normal_conditions(self):
         controller, sim, clock = make_controller_with_fake_clock(normal_conditions=False)
 
@@ -202,7 +217,7 @@ class TestSafety:
         controller.enter_state(GearState.UP_LOCKED)
 
         messages: list[str] = []
-        controller.log = lambda msg: messages.append(msg)
+        controller.log = lambda msg, level=logging.INFO: messages.append(msg)
 
         sim.set_altitude_ft(2000.1)
         controller.update()
@@ -215,7 +230,7 @@ class TestSafety:
         controller.enter_state(GearState.UP_LOCKED)
 
         messages: list[str] = []
-        controller.log = lambda msg: messages.append(msg)
+        controller.log = lambda msg, level=logging.INFO: messages.append(msg)
 
         sim.set_altitude_ft(2000.0)
         controller.update()
@@ -230,20 +245,33 @@ class TestSafety:
         controller.enter_state(GearState.UP_LOCKED)
 
         messages: list[str] = []
-        controller.log = lambda msg: messages.append(msg)
+        controller.log = lambda msg, level=logging.INFO: messages.append(msg)
 
         sim.set_altitude_ft(1999.0)
         controller.update()
 
         assert any("WARNING: ALTITUDE LOW - LANDING GEAR NOT DEPLOYED" in m for m in messages)
 
+    def test_sr002_warning_logged_at_warning_level(self, caplog):
+        controller, sim, clock = make_controller_with_fake_clock(normal_conditions=True)
+
+        controller.enter_state(GearState.UP_LOCKED)
+
+        sim.set_altitude_ft(1999.0)
+        with caplog.at_level(logging.WARNING, logger=LandingGearController.__module__):
+            controller.update()
+
+        warnings = [r.getMessage() for r in caplog.records if r.levelno == logging.WARNING]
+        assert "WARNING: ALTITUDE LOW - LANDING GEAR NOT DEPLOYED" in warnings
+        assert "AURAL WARNING: GEAR" in warnings
+
     def test_sr002_no_warning_when_gear_is_down_locked(self):
         controller, sim, clock = make_controller_with_fake_clock(normal_conditions=True)
 
         controller.enter_state(GearState.DOWN_LOCKED)
 
         messages: list[str] = []
-        controller.log = lambda msg: messages.append(msg)
+        controller.log = lambda msg, level=logging.INFO: messages.append(msg)
 
         sim.set_altitude_ft(1999.0)
         controller.update()
@@ -256,7 +284,7 @@ class TestSafety:
         controller.enter_state(GearState.UP_LOCKED)
 
         messages: list[str] = []
-        controller.log = lambda msg: messages.append(msg)
+        controller.log = lambda msg, level=logging.INFO: messages.append(msg)
 
         sim.set_altitude_ft(1999.0)
         controller.update()
@@ -269,7 +297,7 @@ class TestSafety:
         controller.enter_state(GearState.UP_LOCKED)
 
         messages: list[str] = []
-        controller.log = lambda msg: messages.append(msg)
+        controller.log = lambda msg, level=logging.INFO: messages.append(msg)
 
         sim.set_altitude_ft(float("nan"))
         controller.update()